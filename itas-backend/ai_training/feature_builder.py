@@ -28,16 +28,15 @@ class FeatureBuilder:
         if df is None or df.empty:
             return df
             
-        features = []
-        for _, row in df.iterrows():
-            feat = self.extract_features_from_resume(row.get("raw_text", ""))
-            features.append(feat)
+        raw_texts = df["raw_text"] if "raw_text" in df.columns else [""] * len(df)
+        cleaned_texts = [clean_text(text) for text in raw_texts]
+        batch_skills = self.skill_extractor.extract_skills_batch(cleaned_texts)
+        extracted_skills_list = [[s['name'] for s in skills] for skills in batch_skills]
         
-        df['clean_text'] = [f['clean_text'] for f in features]
+        df['clean_text'] = cleaned_texts
         if 'skills' not in df.columns:
-            df['skills'] = [f['extracted_skills'] for f in features]
+            df['skills'] = extracted_skills_list
         else:
-            extracted_skills_list = [f['extracted_skills'] for f in features]
             df['skills'] = [
                 s if isinstance(s, list) and len(s) > 0 else e 
                 for s, e in zip(df['skills'], extracted_skills_list)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List, Dict, Any
 from core.models import Task, Employee
 
@@ -59,3 +60,9 @@ class RecommendationService:
         ).filter(active_task_count__lt=MAX_CAPACITY)
         
         return list(employees_query)
+
+
+@lru_cache(maxsize=1)
+def get_recommendation_service() -> RecommendationService:
+    """Process-wide RecommendationService; the ranker model is loaded once."""
+    return RecommendationService()
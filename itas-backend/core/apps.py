@@ -6,4 +6,6 @@ class CoreConfig(AppConfig):
     name = "core"
 
     def ready(self):
-        import core.signals
+        # Single canonical import path; receivers carry a dispatch_uid so a
+        # second import (e.g. via a different module path) cannot double-register.
+        from core import signals  # noqa: F401
@@ -8,10 +8,56 @@ from datetime import timezone as dt_timezone
 import jwt
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db.models import Q
 from rest_framework import authentication, exceptions
 
 User = get_user_model()
 
+# Seconds a token's user stays cached; saves/deletes evict it immediately
+USER_CACHE_TIMEOUT = 60
+
+# Columns cached for a token's user: what permission checks and the profile
+# views read. Never the password hash.
+USER_CACHE_FIELDS = (
+    "id",
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "role",
+    "is_active",
+    "is_staff",
+)
+
+
+def user_cache_key(user_id):
+    return f"jwt_user:{user_id}"
+
+
+def get_token_user(user_id):
+    """
+    The user for a token, from a cached dict of USER_CACHE_FIELDS.
+
+    The instance is rebuilt as if loaded with ``.only(*USER_CACHE_FIELDS)``:
+    other columns are deferred, so reading one hits the database and save()
+    writes back only the loaded (or explicitly set) fields.
+    """
+    key = user_cache_key(user_id)
+    fields = cache.get(key)
+    if fields is None:
+        user = User.objects.only(*USER_CACHE_FIELDS).get(id=user_id)
+        cache.set(
+            key,
+            {name: getattr(user, name) for name in USER_CACHE_FIELDS},
+            USER_CACHE_TIMEOUT,
+        )
+        return user
+    # from_db expects the values in model field order
+    names = [f.attname for f in User._meta.concrete_fields if f.attname in fields]
+    return User.from_db(User.objects.db, names, [fields[name] for name in names])
+
 
 class JWTAuthentication(authentication.BaseAuthentication):
     """JWT Token Authentication."""
@@ -46,8 +92,7 @@ class JWTAuthentication(authentication.BaseAuthentication):
             if not user_id:
                 raise exceptions.AuthenticationFailed("Invalid token")
 
-            user = User.objects.get(id=user_id)
-            return (user, None)
+            return (get_token_user(user_id), None)
 
         except jwt.ExpiredSignatureError:
             raise exceptions.AuthenticationFailed("Token expired")
@@ -57,6 +102,44 @@ class JWTAuthentication(authentication.BaseAuthentication):
             raise exceptions.AuthenticationFailed("User not found")
 
 
+class EmailOrUsernameBackend(ModelBackend):
+    """Model backend that accepts either the email or the username as login."""
+
+    # Columns needed to verify a login and serialize the user
+    LOGIN_FIELDS = (
+        "id",
+        "username",
+        "email",
+        "first_name",
+        "last_name",
+        "role",
+        "password",
+        "is_active",
+    )
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if not username or not password:
+            return None
+
+        # One case-insensitive query served by the Upper(email)/Upper(username)
+        # indexes; the password is then checked on this row.
+        user = (
+            User.objects.only(*self.LOGIN_FIELDS)
+            .filter(Q(email__iexact=username) | Q(username__iexact=username))
+            .first()
+        )
+        if user is None:
+            # Hash anyway so unknown accounts take as long as wrong passwords
+            User().set_password(password)
+            return None
+
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+
 def generate_jwt_token(user):
     """Generate JWT token for user."""
     payload = {
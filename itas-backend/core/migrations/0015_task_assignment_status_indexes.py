@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_user_email_upper_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_by', 'status'], name='core_task_creator_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taskassignment',
+            index=models.Index(fields=['employee', 'status'], name='core_assign_emp_status_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-15 23:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_task_assignment_status_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cv',
+            name='parse_attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
@@ -1,7 +1,12 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Least, Upper
 from django.utils import timezone
 
+# Case-insensitive unique email on User; both PostgreSQL and SQLite name it in
+# the IntegrityError message, which tells it apart from a username clash.
+USER_EMAIL_UNIQUE = "core_user_email_upper_uniq"
+
 
 class User(AbstractUser):
     """Custom user model with role-based access."""
@@ -15,9 +20,31 @@ class User(AbstractUser):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta(AbstractUser.Meta):
+        # Login matches with iexact, which PostgreSQL compiles to UPPER(col) = UPPER(%s)
+        indexes = [
+            models.Index(Upper("email"), name="core_user_email_upper_idx"),
+            models.Index(Upper("username"), name="core_user_username_upper_idx"),
+        ]
+        constraints = [
+            # Case-insensitive unique email. Partial (blank emails are allowed for
+            # accounts created without one), so the login lookup keeps using the
+            # plain index above.
+            models.UniqueConstraint(
+                Upper("email"),
+                condition=~models.Q(email=""),
+                name=USER_EMAIL_UNIQUE,
+            ),
+        ]
+
     def __str__(self):
         return f"{self.username} ({self.role})"
 
+    @staticmethod
+    def is_duplicate_email_error(error):
+        """True when an IntegrityError was raised by the unique email constraint."""
+        return USER_EMAIL_UNIQUE in str(error)
+
 
 class Employee(models.Model):
     """Employee profile with CV and skill information."""
@@ -39,6 +66,11 @@ class Employee(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Assignment statuses that count towards workload
+    ACTIVE_STATUSES = ["ASSIGNED", "IN_PROGRESS", "BLOCKED"]
+    # Assuming max capacity of 5 active tasks = 100%
+    MAX_CAPACITY = 5
+
     class Meta:
         ordering = ["-created_at"]
 
@@ -52,21 +84,60 @@ class Employee(models.Model):
     @property
     def skills(self):
         """Get all skills associated with this employee."""
+        if "skill_set" in getattr(self, "_prefetched_objects_cache", {}):
+            return [skill.name for skill in self.skill_set.all()]
         return list(self.skill_set.values_list("name", flat=True))
 
     @property
     def current_workload(self):
         """Calculate current workload as percentage of capacity."""
-        active_tasks = self.taskassignment_set.filter(
-            status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED"]
-        ).count()
-        # Assuming max capacity of 5 active tasks = 100%
-        max_capacity = 5
+        if hasattr(self, "active_assignments"):
+            # Prefetched by list views (see EmployeeViewSet.get_queryset)
+            active_tasks = len(self.active_assignments)
+        elif hasattr(self, "active_task_count"):
+            # Annotated on match candidates (see MatchingEngine)
+            active_tasks = self.active_task_count
+        else:
+            active_tasks = self.taskassignment_set.filter(
+                status__in=self.ACTIVE_STATUSES
+            ).count()
+        return self.workload_from_count(active_tasks)
+
+    @classmethod
+    def workload_from_count(cls, active_tasks):
+        """Workload percentage for an already-known number of active tasks."""
+        max_capacity = cls.MAX_CAPACITY
         return min(100, (active_tasks / max_capacity) * 100) if max_capacity > 0 else 0
 
+    @classmethod
+    def workload_expression(cls):
+        """SQL equivalent of ``current_workload`` for use in annotate()/aggregate()."""
+        active_tasks = models.Count(
+            "taskassignment_set",
+            filter=models.Q(taskassignment_set__status__in=cls.ACTIVE_STATUSES),
+        )
+        return Least(
+            models.ExpressionWrapper(
+                active_tasks * 100.0 / cls.MAX_CAPACITY,
+                output_field=models.FloatField(),
+            ),
+            models.Value(100.0),
+        )
+
+    @classmethod
+    def performance_expression(cls):
+        """SQL equivalent of ``average_performance`` for use in annotate()."""
+        return models.Avg(
+            "taskassignment_set__performance_rating",
+            filter=models.Q(taskassignment_set__status="COMPLETED"),
+        )
+
     @property
     def average_performance(self):
         """Calculate average performance rating from completed tasks."""
+        if hasattr(self, "performance_avg"):
+            # Annotated by list views (see performance_expression)
+            return self.performance_avg
         completed_assignments = self.taskassignment_set.filter(
             status="COMPLETED", performance_rating__isnull=False
         )
@@ -98,6 +169,8 @@ class CV(models.Model):
     uploaded_at = models.DateTimeField(auto_now_add=True)
     processed_at = models.DateTimeField(blank=True, null=True)
     error_message = models.TextField(blank=True, null=True)
+    # Parse attempts that started but never finished (the worker was lost)
+    parse_attempts = models.PositiveSmallIntegerField(default=0)
 
     class Meta:
         ordering = ["-uploaded_at"]
@@ -121,6 +194,9 @@ class Skill(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Rows per INSERT for bulk_create; keeps statements under driver limits
+    BULK_BATCH_SIZE = 500
+
     class Meta:
         unique_together = ["employee", "name"]
         ordering = ["-confidence_score", "name"]
@@ -203,6 +279,12 @@ class Task(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # PM dashboard/report counts: created_by = ? grouped by status
+            models.Index(
+                fields=["created_by", "status"], name="core_task_creator_status_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.priority})"
@@ -210,6 +292,8 @@ class Task(models.Model):
     @property
     def required_skills(self):
         """Get all required skills for this task."""
+        if "task_skills" in getattr(self, "_prefetched_objects_cache", {}):
+            return [skill.skill_name for skill in self.task_skills.all()]
         return list(self.task_skills.values_list("skill_name", flat=True))
 
 
@@ -267,6 +351,12 @@ class TaskAssignment(models.Model):
     class Meta:
         unique_together = ["task", "employee"]
         ordering = ["-suitability_score"]
+        indexes = [
+            # Workload checks: employee = ? AND status IN (ACTIVE_STATUSES)
+            models.Index(
+                fields=["employee", "status"], name="core_assign_emp_status_idx"
+            ),
+        ]
 
     def __str__(self):
         return (
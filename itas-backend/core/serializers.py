@@ -10,6 +10,17 @@ from core.models import CV, Employee, Project, Skill, Task, TaskAssignment, Task
 User = get_user_model()
 
 
+class DynamicFieldsMixin:
+    """Accepts a ``fields`` kwarg restricting which fields are rendered."""
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
 class UserSerializer(serializers.ModelSerializer):
     """User serializer for API responses."""
 
@@ -30,7 +41,7 @@ class UserSerializer(serializers.ModelSerializer):
         return data
 
 
-class EmployeeSerializer(serializers.ModelSerializer):
+class EmployeeSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Employee serializer."""
 
     name = serializers.CharField(required=False)
@@ -62,9 +73,11 @@ class EmployeeSerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
     def get_assigned_tasks(self, obj):
-        assignments = obj.taskassignment_set.filter(
-            status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED"]
-        ).select_related("task")
+        assignments = getattr(obj, "active_assignments", None)
+        if assignments is None:
+            assignments = obj.taskassignment_set.filter(
+                status__in=Employee.ACTIVE_STATUSES
+            ).select_related("task")
 
         return [
             {
@@ -166,7 +179,7 @@ class TaskSkillSerializer(serializers.Serializer):
     skill_name = serializers.CharField(max_length=100)
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Task serializer."""
 
     requiredSkills = serializers.SerializerMethodField()
@@ -213,42 +226,64 @@ class TaskSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_by", "created_at", "updated_at"]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Several fields read the same assignment row; resolve it once per task.
+        self._current_assignments = {}
+        self._completed_assignments = {}
+
     def get_requiredSkills(self, obj):
         return obj.required_skills
 
+    def _current_assignment(self, obj):
+        """Latest non-cancelled assignment, fetched once per task per serializer."""
+        visible = getattr(obj, "visible_assignments", None)
+        if visible is not None:
+            # Prefetched newest-first by TaskViewSet.get_queryset
+            return visible[0] if visible else None
+        cache = self._current_assignments
+        if obj.pk not in cache:
+            cache[obj.pk] = (
+                obj.assignments.filter(status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED", "COMPLETED"])
+                .select_related("employee__user")
+                .order_by("-assigned_at")
+                .first()
+            )
+        return cache[obj.pk]
+
+    def _completed_assignment(self, obj):
+        """Latest completed assignment, fetched once per task per serializer."""
+        visible = getattr(obj, "visible_assignments", None)
+        if visible is not None:
+            return next((a for a in visible if a.status == "COMPLETED"), None)
+        cache = self._completed_assignments
+        if obj.pk not in cache:
+            cache[obj.pk] = (
+                obj.assignments.filter(status="COMPLETED").order_by("-assigned_at").first()
+            )
+        return cache[obj.pk]
+
     def get_assigned_to(self, obj):
         """Get ID of currently assigned employee."""
-        assignment = (
-            obj.assignments.filter(status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED", "COMPLETED"])
-            .order_by("-assigned_at")
-            .first()
-        )
-        return str(assignment.employee.id) if assignment else None
+        assignment = self._current_assignment(obj)
+        return str(assignment.employee_id) if assignment else None
 
     def get_assigned_to_name(self, obj):
         """Get name of currently assigned employee."""
-        assignment = (
-            obj.assignments.filter(status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED", "COMPLETED"])
-            .order_by("-assigned_at")
-            .first()
-        )
+        assignment = self._current_assignment(obj)
         return assignment.employee.name if assignment else None
 
     def get_employee_notes(self, obj):
         """Get latest notes from the assigned employee."""
-        assignment = (
-            obj.assignments.filter(status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED", "COMPLETED"])
-            .order_by("-assigned_at")
-            .first()
-        )
+        assignment = self._current_assignment(obj)
         return assignment.notes if assignment and hasattr(assignment, 'notes') else None
 
     def get_performance_rating(self, obj):
-        assignment = obj.assignments.filter(status="COMPLETED").order_by("-assigned_at").first()
+        assignment = self._completed_assignment(obj)
         return assignment.performance_rating if assignment else None
 
     def get_performance_comments(self, obj):
-        assignment = obj.assignments.filter(status="COMPLETED").order_by("-assigned_at").first()
+        assignment = self._completed_assignment(obj)
         return assignment.performance_comments if assignment else None
 
     def create(self, validated_data):
@@ -0,0 +1,38 @@
+import time
+
+from django.core.cache import cache
+
+
+class CacheService:
+    """
+    Namespaced cache keys with generation-based invalidation.
+
+    Each namespace carries a generation counter that is baked into its keys.
+    Bumping the counter orphans every key in the namespace at once, which works
+    on any cache backend (no delete_pattern / key scanning required); orphaned
+    entries simply expire with their TTL.
+    """
+
+    @staticmethod
+    def _generation_key(namespace):
+        return f"{namespace}:generation"
+
+    @staticmethod
+    def key(namespace, *parts):
+        """Build a cache key for ``namespace`` tied to its current generation."""
+        generation = cache.get_or_set(
+            CacheService._generation_key(namespace), time.time_ns, None
+        )
+        suffix = ":".join(str(part) for part in parts)
+        return f"{namespace}:g{generation}:{suffix}"
+
+    @staticmethod
+    def invalidate(namespace):
+        """Invalidate every key previously built for ``namespace``."""
+        generation_key = CacheService._generation_key(namespace)
+        try:
+            cache.incr(generation_key)
+        except ValueError:
+            # Counter missing (evicted or never set). Seed it from the clock so it
+            # cannot collide with a generation that was handed out before.
+            cache.set(generation_key, time.time_ns(), None)
@@ -6,6 +6,8 @@ Extracts text from uploaded PDF CV files.
 import io
 import os
 import re
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any, Dict, Optional, Union
 
 import joblib
@@ -200,18 +202,11 @@ class CVParser:
     def is_valid_pdf(file: Union[UploadedFile, io.BytesIO, bytes]) -> bool:
         """Check if the uploaded file is a valid PDF."""
         try:
-            if isinstance(file, bytes):
-                file_stream = io.BytesIO(file)
-            elif hasattr(file, "read"):
-                file_content = file.read()
-                if hasattr(file, "seek"):
-                    file.seek(0)  # Reset file pointer
-                file_stream = io.BytesIO(file_content)
-            else:
-                return False
-
-            pdf_reader = PyPDF2.PdfReader(file_stream)
-            return len(pdf_reader.pages) > 0
+            with CVParser._stream(file) as file_stream:
+                if file_stream is None:
+                    return False
+                pdf_reader = PyPDF2.PdfReader(file_stream)
+                return len(pdf_reader.pages) > 0
         except Exception:
             return False
 
@@ -221,21 +216,36 @@ class CVParser:
         import docx
 
         try:
-            if isinstance(file, bytes):
-                doc_file = io.BytesIO(file)
-            elif hasattr(file, "read"):
-                file_content = file.read()
-                if hasattr(file, "seek"):
-                    file.seek(0)  # Reset file pointer
-                doc_file = io.BytesIO(file_content)
-            else:
-                return False
-
-            docx.Document(doc_file)
-            return True
+            with CVParser._stream(file) as doc_file:
+                if doc_file is None:
+                    return False
+                docx.Document(doc_file)
+                return True
         except Exception:
             return False
 
+    @staticmethod
+    @contextmanager
+    def _stream(file):
+        """
+        Seekable stream over ``file`` without copying it.
+
+        Uploads are read in place (a large one is a temp file on disk) and
+        rewound afterwards so they can still be saved.
+        """
+        if isinstance(file, bytes):
+            yield io.BytesIO(file)
+        elif hasattr(file, "read") and hasattr(file, "seek"):
+            file.seek(0)
+            try:
+                yield file
+            finally:
+                file.seek(0)
+        elif hasattr(file, "read"):
+            yield io.BytesIO(file.read())
+        else:
+            yield None
+
     @staticmethod
     def extract_details(text: str) -> Dict[str, Optional[str]]:
         """
@@ -601,3 +611,9 @@ class CVParser:
             print(f"CV_PARSER_ERROR: LLM Title Extraction failed: {e}", flush=True)
             traceback.print_exc()
             return None
+
+
+@lru_cache(maxsize=1)
+def get_cv_parser() -> CVParser:
+    """Process-wide CVParser shared by the views and background tasks."""
+    return CVParser()
@@ -0,0 +1,123 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from core.serializers import TaskMatchSerializer
+from core.services.cache_service import CacheService
+from core.services.matching_engine import get_matching_engine
+
+
+# Backends whose entries live in one process: a worker's writes never reach
+# the web process through them.
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+class MatchService:
+    """Computes and caches the recommended employees for a task."""
+
+    # Seconds a task's match list is served from cache
+    CACHE_TIMEOUT = 300
+    # Seconds a queued refresh keeps readers from computing the same matches;
+    # past that the worker is presumed lost and a read computes inline.
+    PENDING_TIMEOUT = 60
+
+    @staticmethod
+    def cache_key(task):
+        # Task edits change updated_at; skill/assignment/employee changes bump
+        # the namespace generation (see core.signals.invalidate_match_cache).
+        return CacheService.key("task_matches", task.id, task.updated_at.timestamp())
+
+    @staticmethod
+    def pending_key(task_id):
+        return f"task_matches:pending:{task_id}"
+
+    @staticmethod
+    def worker_shares_cache():
+        """Whether matches cached by a Celery worker are visible to this process."""
+        if getattr(settings, "CELERY_TASK_ALWAYS_EAGER", False):
+            return True  # tasks run in this process
+        return settings.CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_CACHE_BACKENDS
+
+    @staticmethod
+    def mark_pending(task):
+        """Record that a worker refresh for ``task`` has been queued."""
+        cache.set(MatchService.pending_key(task.id), True, MatchService.PENDING_TIMEOUT)
+
+    @staticmethod
+    def clear_pending(task_id):
+        cache.delete(MatchService.pending_key(task_id))
+
+    @staticmethod
+    def get_matches(task):
+        """
+        Cached match list for ``task``, computing it on a miss.
+
+        Returns None while a queued worker refresh is still running, so the
+        caller can answer "pending" instead of scoring the task a second time.
+        """
+        cached_matches = cache.get(MatchService.cache_key(task))
+        if cached_matches is not None:
+            return cached_matches
+        if cache.get(MatchService.pending_key(task.id)):
+            return None
+        return MatchService.refresh(task)
+
+    @staticmethod
+    def refresh(task):
+        """Recompute the match list for ``task`` and store it in the cache."""
+        result_data = MatchService.compute(task)
+        cache.set(
+            MatchService.cache_key(task),
+            result_data,
+            timeout=MatchService.CACHE_TIMEOUT,
+        )
+        MatchService.clear_pending(task.id)
+        return result_data
+
+    @staticmethod
+    def compute(task):
+        """Rule-based matches, blended with ML recommendations when enabled."""
+        engine = get_matching_engine()
+        rule_based_results = engine.find_best_matches(task, limit=10, min_score=50.0)
+
+        try:
+            from apps.ai.services.recommendation_service import get_recommendation_service
+            ml_results = get_recommendation_service().get_recommendations(task, limit=10)
+        except Exception as e:
+            print(f"Error calling RecommendationService: {e}")
+            ml_results = []
+
+        if settings.SHADOW_ML_DEPLOYMENT:
+            print(f"SHADOW_ML_DEPLOYMENT: ML Results would have been: {ml_results}")
+            return TaskMatchSerializer(rule_based_results, many=True).data
+
+        if not ml_results:
+            return TaskMatchSerializer(rule_based_results, many=True).data
+
+        # Merge results: if ml_results is non-empty, blend scores:
+        # For each candidate, final_score = (rule_score * 0.6) + (ml_score * 0.4)
+        rule_dict = {m['employee_id']: m['suitability_score'] for m in rule_based_results}
+        merged_results = []
+        for ml_match in ml_results:
+            emp_id = ml_match['employee_id']
+            rule_score = rule_dict.get(emp_id, 0.0)
+            ml_score = ml_match['prediction_score']
+            final_score = (rule_score * 0.6) + (ml_score * 0.4)
+            ml_match['suitability_score'] = final_score
+            merged_results.append(ml_match)
+
+        # Add employees that only appear in rule_based
+        ml_emp_ids = {m['employee_id'] for m in ml_results}
+        for r in rule_based_results:
+            if r['employee_id'] not in ml_emp_ids:
+                # ml_score is 0 for them
+                final_score = r['suitability_score'] * 0.6
+                r['suitability_score'] = final_score
+                merged_results.append(r)
+
+        # Sort by final_score descending
+        merged_results.sort(key=lambda x: x['suitability_score'], reverse=True)
+        # Take top 10
+        return merged_results[:10]
@@ -4,13 +4,14 @@ Calculates how well an employee matches task requirements based on skills, workl
 """
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
-from django.db.models import Case, Count, F, Q, Value, When
+from django.db.models import Case, Count, F, Prefetch, Q, Value, When
 from django.db.models.functions import Lower
 
-from core.models import Employee, Task
-from core.services.skill_extractor import SkillExtractor
+from core.models import Employee, Task, TaskAssignment
+from core.services.skill_extractor import get_skill_extractor
 
 
 class MatchingEngine:
@@ -40,7 +41,7 @@ class MatchingEngine:
                 "performance": 0.1,
             },
         }
-        self.skill_extractor = SkillExtractor()
+        self.skill_extractor = get_skill_extractor()
         
         from core.services.ml.inference_pipeline import InferencePipeline
         self.ml_pipeline = InferencePipeline()
@@ -145,13 +146,14 @@ class MatchingEngine:
             skill_profile[key] = max(skill_profile.get(key, 0.0), confidence)
 
         # Enhance with historical real performance from tasks
-        from core.models import TaskAssignment
         import math
         from django.utils import timezone
         
-        completed_assignments = TaskAssignment.objects.filter(
-            employee=employee, status="COMPLETED"
-        ).prefetch_related('skill_evaluations')
+        completed_assignments = getattr(employee, "completed_assignments", None)
+        if completed_assignments is None:
+            completed_assignments = TaskAssignment.objects.filter(
+                employee=employee, status="COMPLETED"
+            ).prefetch_related('skill_evaluations')
         
         now = timezone.now()
         
@@ -224,11 +226,13 @@ class MatchingEngine:
 
     def _calculate_performance_score(self, employee: Employee) -> float:
         """Calculate performance score based on past tasks rating and consistency (0-1)."""
-        from core.models import TaskAssignment
-        completed_assignments = TaskAssignment.objects.filter(
-            employee=employee, status="COMPLETED"
-        )
-        if not completed_assignments.exists():
+        # Prefetched for match candidates (see _candidate_queryset)
+        completed_assignments = getattr(employee, "completed_assignments", None)
+        if completed_assignments is None:
+            completed_assignments = list(
+                TaskAssignment.objects.filter(employee=employee, status="COMPLETED")
+            )
+        if not completed_assignments:
             return 0.5  # Neutral score for new employees without history
             
         total_rating = 0
@@ -327,6 +331,34 @@ class MatchingEngine:
             priority.upper(), self.weights_by_priority["MEDIUM"]
         )
 
+    def _candidate_queryset(self):
+        """
+        Employees with everything scoring and serialization read, loaded up front:
+        skills, CV, completed assignments, active task count and average rating.
+        """
+        return (
+            Employee.objects.select_related("user", "cv")
+            .prefetch_related(
+                "skill_set",
+                Prefetch(
+                    "taskassignment_set",
+                    queryset=TaskAssignment.objects.filter(
+                        status="COMPLETED"
+                    ).prefetch_related("skill_evaluations"),
+                    to_attr="completed_assignments",
+                ),
+            )
+            .annotate(
+                # distinct: the skill pre-filter joins skills and repeats rows
+                active_task_count=Count(
+                    "taskassignment_set",
+                    filter=Q(taskassignment_set__status__in=Employee.ACTIVE_STATUSES),
+                    distinct=True,
+                ),
+                performance_avg=Employee.performance_expression(),
+            )
+        )
+
     def find_best_matches(
         self, task: Task, limit: int = 10, min_score: float = 50.0
     ) -> List[Dict[str, Any]]:
@@ -351,26 +383,10 @@ class MatchingEngine:
         # Assuming max capacity of 5 tasks = 100% workload
         MAX_CAPACITY = 5
 
-        employees_query = Employee.objects.select_related("user").prefetch_related(
-            "skill_set"
-        )
-
-        # Annotate with active task count
-        employees_query = employees_query.annotate(
-            active_task_count=Count(
-                "taskassignment_set",
-                filter=Q(
-                    taskassignment_set__status__in=[
-                        "ASSIGNED",
-                        "IN_PROGRESS",
-                        "BLOCKED",
-                    ]
-                ),
-            )
-        )
-
         # Filter 1: Exclude fully booked employees (Active tasks < MAX_CAPACITY)
-        employees_query = employees_query.filter(active_task_count__lt=MAX_CAPACITY)
+        employees_query = self._candidate_queryset().filter(
+            active_task_count__lt=MAX_CAPACITY
+        )
 
         # Filter 2: Pre-filter by skills if any are required
         # This is fuzzy matching limited by SQL capabilities, but significantly reduces candidate pool
@@ -399,21 +415,9 @@ class MatchingEngine:
                 "MATCHING_ENGINE: Strict skill filtering yielded 0 candidates. Falling back to workload-only filtering."
             )
             # Fallback: Just filter by workload if skill match was too strict or data is dirty
-            employees_query = Employee.objects.select_related("user").prefetch_related(
-                "skill_set"
+            employees_query = self._candidate_queryset().filter(
+                active_task_count__lt=MAX_CAPACITY
             )
-            employees_query = employees_query.annotate(
-                active_task_count=Count(
-                    "taskassignment_set",
-                    filter=Q(
-                        taskassignment_set__status__in=[
-                            "ASSIGNED",
-                            "IN_PROGRESS",
-                            "BLOCKED",
-                        ]
-                    ),
-                )
-            ).filter(active_task_count__lt=MAX_CAPACITY)
             candidates = list(employees_query)
 
         matches = []
@@ -492,3 +496,9 @@ class MatchingEngine:
                 missing.append(self.skill_extractor.normalize_skill_name(skill))
 
         return missing
+
+
+@lru_cache(maxsize=1)
+def get_matching_engine() -> MatchingEngine:
+    """Process-wide MatchingEngine; avoids rebuilding the ML pipeline per request."""
+    return MatchingEngine()
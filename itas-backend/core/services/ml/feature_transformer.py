@@ -1,12 +1,12 @@
 from core.services.text_preprocessor import clean_text
-from core.services.skill_extractor import SkillExtractor
+from core.services.skill_extractor import get_skill_extractor
 from core.services.ml.model_registry import ModelRegistry
 
 class FeatureTransformer:
     """Transforms raw input text into model-ready features."""
     
     def __init__(self):
-        self.skill_extractor = SkillExtractor()
+        self.skill_extractor = get_skill_extractor()
         
     def transform_text_to_tfidf(self, text: str):
         """Transform text using the TF-IDF matching vectorizer."""
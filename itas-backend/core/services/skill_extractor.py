@@ -3,7 +3,10 @@ Skill Extraction Service using curated patterns and section heuristics.
 Extracts technical skills from CV text using fast NLP-lite techniques.
 """
 
+import heapq
 import re
+from collections import Counter
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Pattern, Set
 import logging
 
@@ -15,6 +18,17 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Skill-section delimiters are single characters, so a translate table plus
+# str.split is cheaper than running the regex engine over each section.
+_DELIM_TRANS = str.maketrans({",": "\n", ";": "\n", "•": "\n", "|": "\n"})
+_HAS_ALNUM_RE = re.compile(r"[^\W_]")
+
+# Skill-key cleanup patterns, compiled once for normalize_skill_key.
+_BRACKETS_RE = re.compile(r"[()\[\]{}]")
+_UNDERSCORES_RE = re.compile(r"[_]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_VERSION_SUFFIX_RE = re.compile(r"\d+(\.\d+)*$")
+
 
 class SkillExtractor:
     """Service for extracting skills from CV text using NLP-lite heuristics."""
@@ -273,8 +287,10 @@ class SkillExtractor:
 
     # Class-level cache
     _known_skill_keys: Optional[Set[str]] = None
+    _display_names: Optional[Dict[str, str]] = None
     _nlp = None
     _matcher = None
+    _nlp_load_attempted = False
 
     def __init__(self):
         # Initialize class-level attributes if not done yet
@@ -283,7 +299,17 @@ class SkillExtractor:
                 self.SKILL_ALIASES.keys()
             )
 
-        if spacy and SkillExtractor._nlp is None:
+        if SkillExtractor._display_names is None:
+            # Canonical keys are known up front, so their display form can be
+            # computed once instead of on every normalize_skill_name call.
+            SkillExtractor._display_names = {
+                key: self._format_display_name(key) for key in self.TECHNICAL_SKILLS
+            }
+
+        if spacy and not SkillExtractor._nlp_load_attempted:
+            # Only try once per process; a missing model should not be
+            # re-probed on every construction.
+            SkillExtractor._nlp_load_attempted = True
             try:
                 SkillExtractor._nlp = spacy.load("en_core_web_sm")
                 SkillExtractor._matcher = PhraseMatcher(SkillExtractor._nlp.vocab, attr="LOWER")
@@ -295,8 +321,11 @@ class SkillExtractor:
                 logger.error(f"Failed to initialize spaCy: {e}. Ensure en_core_web_sm is downloaded.")
                 SkillExtractor._nlp = None
 
+    # Hard cap on text handed to spaCy to avoid memory issues with NLP
+    MAX_NLP_CHARS = 50000
+
     def extract_skills(
-        self, text: str, min_confidence: float = 0.3
+        self, text: str, min_confidence: float = 0.3, top_k: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Extract skills from CV text using spaCy.
@@ -304,35 +333,85 @@ class SkillExtractor:
         Args:
             text: CV text content
             min_confidence: Minimum confidence score to include skill
+            top_k: If given, only return the ``top_k`` highest-confidence skills
 
         Returns:
             List of dictionaries with 'name' and 'confidence_score'
+
+        Confidence is capped at 1.0, so ``min_confidence > 1.0`` returns an
+        empty list without running any extraction pass. Lower thresholds run
+        every pass: repeated mentions and section hits can lift a skill from
+        either pass up to the cap, so neither pass can be pruned up front.
         """
-        if not text:
+        if not text or min_confidence > 1.0:
             return []
 
-        found_skills: Dict[str, Dict[str, Any]] = {}
+        doc = None
+        if SkillExtractor._nlp and SkillExtractor._matcher:
+            # The matcher only compares LOWER lexeme attributes, so tokenizing is
+            # enough; running the full pipeline (tagger/parser/NER) is wasted work.
+            doc = SkillExtractor._nlp.make_doc(text[: self.MAX_NLP_CHARS])
+
+        return self._extract_skills_from_doc(text, doc, min_confidence, top_k)
+
+    def extract_skills_batch(
+        self, texts: List[str], min_confidence: float = 0.3
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Extract skills from many texts at once (e.g. building a training set).
+
+        Tokenization goes through spaCy's batched ``tokenizer.pipe`` instead of
+        one ``make_doc`` call per text; per-text results match ``extract_skills``.
+        """
+        if min_confidence > 1.0:
+            return [[] for _ in texts]
+
+        texts = [text or "" for text in texts]
 
         if SkillExtractor._nlp and SkillExtractor._matcher:
+            docs = SkillExtractor._nlp.tokenizer.pipe(
+                text[: self.MAX_NLP_CHARS] for text in texts
+            )
+        else:
+            docs = (None for _ in texts)
+
+        return [
+            self._extract_skills_from_doc(text, doc, min_confidence) if text else []
+            for text, doc in zip(texts, docs)
+        ]
+
+    def _extract_skills_from_doc(
+        self,
+        text: str,
+        doc: Any,
+        min_confidence: float,
+        top_k: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        found_skills: Dict[str, Dict[str, Any]] = {}
+
+        if doc is not None:
             # Method 1: spaCy PhraseMatcher
-            # Truncate text if extremely long to avoid memory issues with NLP
-            doc = SkillExtractor._nlp(text[:50000])
             matches = SkillExtractor._matcher(doc)
-            
-            for match_id, start, end in matches:
-                span = doc[start:end]
-                skill_key = self.normalize_skill_key(span.text)
+
+            # Tally surface forms first so normalization and record creation
+            # happen once per distinct skill rather than once per mention.
+            mention_counts = Counter(
+                doc[start:end].text.lower() for _, start, end in matches
+            )
+
+            for mention, count in mention_counts.items():
+                skill_key = self.normalize_skill_key(mention)
                 if not skill_key:
                     continue
-                    
+
                 if skill_key not in found_skills:
                     found_skills[skill_key] = {
-                        "name": self.normalize_skill_name(skill_key),
+                        "name": self._display_name(skill_key),
                         "confidence_score": 0.85, # High confidence for exact spacy matches
                         "count": 0,
                     }
-                found_skills[skill_key]["count"] += 1
-                
+                found_skills[skill_key]["count"] += count
+
         # Method 2: Context-based extraction (look for skill sections) as fallback/supplement
         skill_sections = self._extract_skill_sections(text)
         for skill in skill_sections:
@@ -345,7 +424,7 @@ class SkillExtractor:
 
             if skill_key not in found_skills:
                 found_skills[skill_key] = {
-                    "name": self.normalize_skill_name(skill_key),
+                    "name": self._display_name(skill_key),
                     "confidence_score": base_confidence,
                     "count": 1,
                 }
@@ -373,6 +452,10 @@ class SkillExtractor:
             if skill_data["confidence_score"] >= min_confidence
         ]
 
+        if top_k is not None:
+            # Partial selection is O(n log k) instead of a full sort
+            return heapq.nlargest(top_k, result, key=lambda x: x["confidence_score"])
+
         result.sort(key=lambda x: x["confidence_score"], reverse=True)
         return result
 
@@ -402,49 +485,17 @@ class SkillExtractor:
                 section_text = text[start_pos : start_pos + 500]
 
                 # Extract potential skills (words/phrases separated by commas, semicolons, or newlines)
-                skill_items = re.split(r"[,;\n•\|]", section_text)
+                skill_items = section_text.translate(_DELIM_TRANS).split("\n")
                 for item in skill_items:
                     item = item.strip()
                     if item and len(item) > 2 and len(item) < 50:
                         # Check if it looks like a skill
-                        if any(char.isalnum() for char in item):
+                        if _HAS_ALNUM_RE.search(item) is not None:
                             skills.append(item)
 
         deduped = list(dict.fromkeys(skills))
         return deduped[:25]
 
-    def _extract_compound_skills(self, text: str) -> List[str]:
-        """Extract compound skills (multi-word phrases)."""
-        compound_patterns = [
-            r"machine\s+learning",
-            r"deep\s+learning",
-            r"artificial\s+intelligence",
-            r"natural\s+language\s+processing",
-            r"data\s+science",
-            r"data\s+analysis",
-            r"data\s+engineering",
-            r"project\s+management",
-            r"stakeholder\s+management",
-            r"unit\s+testing",
-            r"integration\s+testing",
-            r"test\s+automation",
-            r"react\s+native",
-            r"node\.js",
-            r"next\.js",
-            r"nuxt\.js",
-            r"ci/cd",
-            r"ui\s*/\s*ux",
-        ]
-
-        found = []
-        text_lower = text.lower()
-        for pattern in compound_patterns:
-            matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-            for match in matches:
-                found.append(match.group())
-
-        return list(set(found))
-
     def normalize_skill_key(self, skill: str) -> str:
         """Normalize skill key for matching and de-duplication."""
         if not skill:
@@ -455,15 +506,15 @@ class SkillExtractor:
 
         key = skill.strip().lower()
         key = key.replace("&", "and")
-        key = re.sub(r"[()\[\]{}]", " ", key)
-        key = re.sub(r"[_]+", " ", key)
-        key = re.sub(r"\s+", " ", key).strip()
+        key = _BRACKETS_RE.sub(" ", key)
+        key = _UNDERSCORES_RE.sub(" ", key)
+        key = _WHITESPACE_RE.sub(" ", key).strip()
         key = key.replace(" / ", "/")
 
         # Handle cases like "python3" -> "python"
         if key not in self._known_skill_keys:
             # Try stripping version numbers if the skill isn't known
-            key_no_version = re.sub(r"\d+(\.\d+)*$", "", key).strip()
+            key_no_version = _VERSION_SUFFIX_RE.sub("", key).strip()
             if key_no_version in self._known_skill_keys:
                 key = key_no_version
 
@@ -475,6 +526,23 @@ class SkillExtractor:
         if not key:
             return ""
 
+        return self._display_name(key)
+
+    def normalize_skill_names(self, skills: List[str]) -> List[str]:
+        """Normalize a list of skill names for display, preserving order."""
+        normalize_key = self.normalize_skill_key
+        display_name = self._display_name
+        return [display_name(key) if key else "" for key in map(normalize_key, skills)]
+
+    def _display_name(self, key: str) -> str:
+        """Display name for an already-normalized skill key."""
+        display = self._display_names.get(key)
+        if display:
+            return display
+
+        return self._format_display_name(key)
+
+    def _format_display_name(self, key: str) -> str:
         display = self.DISPLAY_NAMES.get(key)
         if display:
             return display
@@ -488,3 +556,9 @@ class SkillExtractor:
                 formatted.append(part.capitalize())
 
         return " ".join(formatted)
+
+
+@lru_cache(maxsize=1)
+def get_skill_extractor() -> SkillExtractor:
+    """Process-wide SkillExtractor; its state is read-only after construction."""
+    return SkillExtractor()
@@ -20,6 +20,11 @@ TOKEN_REPLACEMENTS = {
     "ci-cd": "cicd",
 }
 
+# Letter-spaced headings in some PDF exports ("P y t h o n", "P ython")
+_SPACED_LETTERS_RE = re.compile(r"\b([A-Za-z]\s){2,}[A-Za-z]\b")
+_SPACED_LETTER_RE = re.compile(r"([A-Za-z])\s(?=[A-Za-z]\b)")
+_SPLIT_INITIAL_RE = re.compile(r"\b([A-Za-z])\s([A-Za-z]{3,})\b")
+
 
 def clean_text(text: str) -> str:
     """Normalize resume text for model training/inference."""
@@ -39,3 +44,10 @@ def clean_text(text: str) -> str:
     normalized = re.sub(r"\s+", " ", normalized).strip()
 
     return normalized
+
+
+def clean_extracted_text(text: str) -> str:
+    """Rejoin letters that PDF extraction split apart before skill matching."""
+    if _SPACED_LETTERS_RE.search(text):
+        text = _SPACED_LETTER_RE.sub(r"\1", text)
+    return _SPLIT_INITIAL_RE.sub(r"\1\2", text)
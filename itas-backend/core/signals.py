@@ -1,11 +1,19 @@
-from django.db.models.signals import post_save, pre_save
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from core.models import Task, TaskAssignment
+from core.authentication import user_cache_key
+from core.models import Employee, Skill, Task, TaskAssignment, TaskSkill, User
+from core.services.cache_service import CacheService
 from core.services.email_service import EmailService
 
 
-@receiver(post_save, sender=TaskAssignment)
+@receiver(
+    post_save,
+    sender=TaskAssignment,
+    dispatch_uid="core.signals.notify_employee_on_assignment",
+)
 def notify_employee_on_assignment(sender, instance, created, **kwargs):
     """
     Trigger email when a new Task Assignment is created.
@@ -24,7 +32,11 @@ def notify_employee_on_assignment(sender, instance, created, **kwargs):
         EmailService.send_task_assignment_email(employee, task)
 
 
-@receiver(post_save, sender=Task)
+@receiver(
+    post_save,
+    sender=Task,
+    dispatch_uid="core.signals.sync_assignment_status",
+)
 def sync_assignment_status(sender, instance, created, **kwargs):
     """
     Sync Task status changes to TaskAssignments to ensure workload is accurate.
@@ -47,7 +59,11 @@ def sync_assignment_status(sender, instance, created, **kwargs):
         pass
 
 
-@receiver(pre_save, sender=Task)
+@receiver(
+    pre_save,
+    sender=Task,
+    dispatch_uid="core.signals.notify_pm_on_completion",
+)
 def notify_pm_on_completion(sender, instance, **kwargs):
     """
     Trigger email when task status changes to DONE.
@@ -69,7 +85,11 @@ def notify_pm_on_completion(sender, instance, **kwargs):
         except Task.DoesNotExist:
             pass
 
-@receiver(post_save, sender=TaskAssignment)
+@receiver(
+    post_save,
+    sender=TaskAssignment,
+    dispatch_uid="core.signals.capture_training_data_on_completion",
+)
 def capture_training_data_on_completion(sender, instance, **kwargs):
     """
     Feedback Learning Loop: When a TaskAssignment is updated with a performance rating
@@ -112,3 +132,67 @@ def capture_training_data_on_completion(sender, instance, **kwargs):
         
     except Exception as e:
         print(f"Error capturing training data: {e}")
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Employee,
+    dispatch_uid="core.signals.invalidate_dashboard_cache",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Task,
+    dispatch_uid="core.signals.invalidate_dashboard_cache",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=TaskAssignment,
+    dispatch_uid="core.signals.invalidate_dashboard_cache",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=TaskSkill,
+    dispatch_uid="core.signals.invalidate_dashboard_cache",
+)
+def invalidate_dashboard_cache(sender, **kwargs):
+    """Drop cached dashboard stats whenever data feeding them changes."""
+    # After commit, so a concurrent read cannot re-cache pre-commit stats
+    transaction.on_commit(lambda: CacheService.invalidate("dashboard"))
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=User,
+    dispatch_uid="core.signals.invalidate_jwt_user_cache",
+)
+def invalidate_jwt_user_cache(sender, instance, **kwargs):
+    """Evict the cached token user so profile/role/password changes apply at once."""
+    # After commit, so a concurrent request cannot re-cache the old row
+    key = user_cache_key(instance.pk)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Employee,
+    dispatch_uid="core.signals.invalidate_match_cache",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Skill,
+    dispatch_uid="core.signals.invalidate_match_cache",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=TaskAssignment,
+    dispatch_uid="core.signals.invalidate_match_cache",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=TaskSkill,
+    dispatch_uid="core.signals.invalidate_match_cache",
+)
+def invalidate_match_cache(sender, **kwargs):
+    """Drop cached task matches when skills, workload or ratings may have moved."""
+    # After commit, so a concurrent read cannot re-cache pre-commit matches
+    transaction.on_commit(lambda: CacheService.invalidate("task_matches"))
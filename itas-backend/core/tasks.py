@@ -1,61 +1,126 @@
 from celery import shared_task
+from django.db import OperationalError
 from core.models import CV, Employee, Task
-from core.services.cv_parser import CVParser
+from core.services.cache_service import CacheService
+from core.services.cv_parser import get_cv_parser
 from core.services.ml.feature_transformer import FeatureTransformer
+from core.services.text_preprocessor import clean_extracted_text
 
-@shared_task
-def parse_cv_async(cv_id):
+# Failures worth another attempt: storage hiccups and dropped DB connections.
+# Anything else (bad file, parser bug) fails the CV straight away.
+CV_RETRYABLE_ERRORS = (OSError, OperationalError)
+# OSErrors that will not go away on a retry (missing or unreadable file)
+CV_PERMANENT_ERRORS = (
+    FileNotFoundError,
+    IsADirectoryError,
+    NotADirectoryError,
+    PermissionError,
+)
+# Parses a CV may start without finishing (worker killed, e.g. OOM on a
+# malformed file) before it is failed instead of redelivered again
+CV_MAX_PARSE_ATTEMPTS = 3
+
+
+# Ack after the task finishes so a worker restart re-queues the in-flight CV.
+@shared_task(
+    bind=True,
+    autoretry_for=CV_RETRYABLE_ERRORS,
+    retry_backoff=True,
+    max_retries=3,
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def parse_cv_async(self, cv_id):
     try:
         cv = CV.objects.get(id=cv_id)
+        # parse_attempts is only left raised by attempts that died mid-parse;
+        # messages redelivered before parsing started do not count.
+        if cv.parse_attempts >= CV_MAX_PARSE_ATTEMPTS:
+            cv.status = "FAILED"
+            cv.error_message = "Worker was lost while parsing this CV"
+            cv.save()
+            return False
+
         cv.status = "PROCESSING"
+        cv.parse_attempts += 1
         cv.save()
         
-        parser = CVParser()
+        parser = get_cv_parser()
         
+        # Open through the storage backend (local disk or object storage) by
+        # name; no file handle is shared with the upload request.
+        with cv.file.storage.open(cv.file.name, "rb") as f:
+            raw = f.read()
+
         extracted_text = None
         if cv.file.name.lower().endswith(".pdf"):
-            extracted_text = parser.extract_text_from_pdf(cv.file.path)
+            extracted_text = parser.extract_text_from_pdf(raw)
         elif cv.file.name.lower().endswith(".docx"):
-            extracted_text = parser.extract_text_from_docx(cv.file.path)
+            extracted_text = parser.extract_text_from_docx(raw)
             
         cv.extracted_text = extracted_text or ''
         cv.status = "READY"
         cv.save()
         
         if extracted_text:
-            from core.services.skill_extractor import SkillExtractor
+            from core.services.skill_extractor import get_skill_extractor
             from core.models import Skill
             from django.db import transaction
-            import re
-            
-            extractor = SkillExtractor()
-            cleaned_text = extracted_text
-            if re.search(r"\b([A-Za-z]\s){2,}[A-Za-z]\b", cleaned_text):
-                cleaned_text = re.sub(r"([A-Za-z])\s(?=[A-Za-z]\b)", r"\1", cleaned_text)
-            cleaned_text = re.sub(r"\b([A-Za-z])\s([A-Za-z]{3,})\b", r"\1\2", cleaned_text)
 
-            skills_data = extractor.extract_skills(cleaned_text)
+            extractor = get_skill_extractor()
+            skills_data = extractor.extract_skills(
+                clean_extracted_text(extracted_text)
+            )
 
-            with transaction.atomic():
-                Skill.objects.filter(employee=cv.employee, source="CV").delete()
-                for skill_data in skills_data:
-                    skill_name = extractor.normalize_skill_name(skill_data["name"])
-                    Skill.objects.update_or_create(
+            # Several extracted names can normalize to the same skill; keep the
+            # first (highest confidence) so the upsert touches each row once.
+            skill_names = extractor.normalize_skill_names(
+                [skill_data["name"] for skill_data in skills_data]
+            )
+            skills = {}
+            for skill_name, skill_data in zip(skill_names, skills_data):
+                skills.setdefault(
+                    skill_name,
+                    Skill(
                         employee=cv.employee,
                         name=skill_name,
-                        defaults={
-                            "source": "CV",
-                            "confidence_score": skill_data["confidence_score"],
-                        },
-                    )
+                        source="CV",
+                        confidence_score=skill_data["confidence_score"],
+                    ),
+                )
+
+            # Upsert first, then drop only the CV skills this CV no longer
+            # yields, instead of deleting and re-inserting every row.
+            with transaction.atomic():
+                Skill.objects.bulk_create(
+                    skills.values(),
+                    batch_size=Skill.BULK_BATCH_SIZE,
+                    update_conflicts=True,
+                    unique_fields=["employee", "name"],
+                    update_fields=["source", "confidence_score"],
+                )
+                Skill.objects.filter(employee=cv.employee, source="CV").exclude(
+                    name__in=list(skills)
+                ).delete()
+            # bulk_create sends no post_save, so the signal receiver never sees it
+            CacheService.invalidate("task_matches")
 
         return True
     except Exception as e:
+        if (
+            isinstance(e, CV_RETRYABLE_ERRORS)
+            and not isinstance(e, CV_PERMANENT_ERRORS)
+            and self.request.retries < self.max_retries
+        ):
+            raise  # autoretry_for re-queues with exponential backoff
         if 'cv' in locals():
             cv.status = "FAILED"
             cv.error_message = str(e)
             cv.save()
         return False
+    finally:
+        # The attempt ran to an end (success, failure or retry): not lost
+        CV.objects.filter(id=cv_id, parse_attempts__gt=0).update(parse_attempts=0)
 
 @shared_task
 def generate_embeddings_async(employee_id):
@@ -73,13 +138,14 @@ def generate_embeddings_async(employee_id):
 
 @shared_task
 def refresh_recommendations_async(task_id):
-    """Placeholder to recalculate rankings for a task asynchronously."""
+    """Recalculate and cache the recommended employees for a task."""
+    from core.services.match_service import MatchService
     try:
         task = Task.objects.get(id=task_id)
-        # Re-compute recommendations using matching engine
-        from core.services.matching_engine import MatchingEngine
-        engine = MatchingEngine()
-        # the engine caches or stores the result
+        MatchService.refresh(task)
         return True
     except Exception as e:
+        print(f"Error refreshing recommendations for task {task_id}: {e}")
+        # Let the next read compute inline instead of waiting out the marker
+        MatchService.clear_pending(task_id)
         return False
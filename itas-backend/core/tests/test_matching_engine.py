@@ -1,5 +1,8 @@
 import pytest
-from core.models import User, Employee, Task
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.models import User, Employee, Task, TaskAssignment
 from core.services.matching_engine import MatchingEngine
 
 @pytest.mark.django_db
@@ -13,3 +16,43 @@ def test_matching_engine_empty_task():
     
     score = engine.calculate_suitability_score(employee, task, [])
     assert 0 <= score <= 100
+
+
+def _add_candidate(pm, i, rating):
+    user = User.objects.create_user(username=f"cand{i}", password="123")
+    employee = Employee.objects.create(user=user, title="Developer")
+    employee.skill_set.create(name="Python")
+    employee.skill_set.create(name="Python Scripting")
+    done = Task.objects.create(title=f"Done {i}", created_by=pm, status="COMPLETED")
+    TaskAssignment.objects.create(
+        task=done, employee=employee, suitability_score=80,
+        status="COMPLETED", performance_rating=rating,
+    )
+    active = Task.objects.create(title=f"Active {i}", created_by=pm, status="ASSIGNED")
+    TaskAssignment.objects.create(task=active, employee=employee, suitability_score=80)
+    return employee
+
+
+def _count_match_queries(task):
+    with CaptureQueriesContext(connection) as ctx:
+        matches = MatchingEngine().find_best_matches(task, min_score=0)
+    return len(ctx), matches
+
+
+@pytest.mark.django_db
+def test_find_best_matches_uses_constant_queries():
+    pm = User.objects.create_user(username="pm", password="123", role="PM")
+    task = Task.objects.create(title="Script", priority="MEDIUM", created_by=pm)
+    task.task_skills.create(skill_name="Python")
+
+    _add_candidate(pm, 0, 4)
+    before, _ = _count_match_queries(task)
+    for i in range(1, 4):
+        _add_candidate(pm, i, 2)
+    after, matches = _count_match_queries(task)
+
+    assert after == before
+    first = next(m for m in matches if m["employee_name"] == "cand0")
+    # Two matching skills must not double the active task count
+    assert first["current_workload"] == 20.0
+    assert first["average_performance"] == 4.0
@@ -1,4 +1,5 @@
 import pytest
+from django.contrib.auth.hashers import make_password
 
 from core.models import User
 
@@ -14,3 +15,15 @@ def test_create_user():
     assert user.username == "testuser"
     assert user.role == "EMPLOYEE"
     assert user.check_password("testpassword123") is True
+
+
+@pytest.mark.django_db
+def test_passwords_hash_with_argon2_and_upgrade_pbkdf2():
+    user = User.objects.create_user(username="argon", password="testpassword123")
+    assert user.password.startswith("argon2")
+
+    user.password = make_password("testpassword123", hasher="pbkdf2_sha256")
+    user.save()
+    assert user.check_password("testpassword123") is True
+    user.refresh_from_db()
+    assert user.password.startswith("argon2")
@@ -0,0 +1,32 @@
+import pytest
+
+from core.models import Employee, Task, TaskAssignment, User
+from core.serializers import TaskSerializer
+
+
+@pytest.mark.django_db
+def test_task_serializer_resolves_assignment_once(django_assert_max_num_queries):
+    pm = User.objects.create_user(username="pm", password="123", role="PM")
+    user = User.objects.create_user(
+        username="dev", password="123", first_name="Dana", last_name="Dev"
+    )
+    employee = Employee.objects.create(user=user, title="Developer")
+    task = Task.objects.create(title="Build API", created_by=pm, status="COMPLETED")
+    TaskAssignment.objects.create(
+        task=task,
+        employee=employee,
+        suitability_score=80.0,
+        status="COMPLETED",
+        notes="Done",
+        performance_rating=4.5,
+    )
+    task = Task.objects.select_related("created_by", "project").get(pk=task.pk)
+
+    # requiredSkills + current assignment (with employee/user) + completed assignment
+    with django_assert_max_num_queries(3):
+        data = TaskSerializer(task).data
+
+    assert data["assigned_to"] == str(employee.id)
+    assert data["assigned_to_name"] == "Dana Dev"
+    assert data["employee_notes"] == "Done"
+    assert data["performance_rating"] == 4.5
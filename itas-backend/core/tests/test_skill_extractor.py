@@ -0,0 +1,63 @@
+from core.services.skill_extractor import SkillExtractor, get_skill_extractor
+from core.services.text_preprocessor import clean_extracted_text
+
+CV_TEXT = """Jane Doe
+Backend Developer
+
+Skills:
+Python, Django, PostgreSQL, Docker, Kubernetes, Redis
+"""
+
+
+def test_extract_skills_returns_sorted_by_confidence():
+    skills = SkillExtractor().extract_skills(CV_TEXT)
+    scores = [s["confidence_score"] for s in skills]
+    assert scores == sorted(scores, reverse=True)
+    assert "Python" in [s["name"] for s in skills]
+
+
+def test_extract_skills_top_k_matches_full_sort_prefix():
+    extractor = SkillExtractor()
+    full = extractor.extract_skills(CV_TEXT)
+    top = extractor.extract_skills(CV_TEXT, top_k=3)
+    assert len(top) == 3
+    assert [s["confidence_score"] for s in top] == [
+        s["confidence_score"] for s in full[:3]
+    ]
+
+
+def test_normalize_skill_name_uses_canonical_display_names():
+    extractor = SkillExtractor()
+    assert extractor.normalize_skill_name("nodejs") == "Node.js"
+    assert extractor.normalize_skill_name("  Rest API ") == "REST"
+    assert extractor.normalize_skill_name("unit testing") == "Unit Testing"
+    assert extractor.normalize_skill_name("custom tool") == "Custom Tool"
+
+
+def test_extract_skills_batch_matches_single_calls():
+    extractor = SkillExtractor()
+    texts = [CV_TEXT, "", "Skills: Java; Spring | Kafka"]
+    batch = extractor.extract_skills_batch(texts)
+    assert batch == [extractor.extract_skills(text) for text in texts]
+
+
+def test_extract_skills_unreachable_threshold_short_circuits():
+    extractor = SkillExtractor()
+    assert extractor.extract_skills(CV_TEXT, min_confidence=1.01) == []
+    assert extractor.extract_skills_batch([CV_TEXT], min_confidence=1.01) == [[]]
+
+
+def test_get_skill_extractor_returns_shared_instance():
+    assert get_skill_extractor() is get_skill_extractor()
+
+
+def test_normalize_skill_names_matches_single_normalization():
+    extractor = SkillExtractor()
+    names = ["python3", "Node.JS", "machine_learning", "", "(React)"]
+    assert extractor.normalize_skill_names(names) == [
+        extractor.normalize_skill_name(name) for name in names
+    ]
+
+
+def test_clean_extracted_text_rejoins_split_letters():
+    assert clean_extracted_text("Skills: P y t h o n, D jango") == "Skills: Python, Django"
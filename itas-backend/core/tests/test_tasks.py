@@ -0,0 +1,128 @@
+import pytest
+from celery.exceptions import Retry
+
+from core.models import CV, Employee, Skill, User
+from core.services.cv_parser import CVParser
+from core.tasks import CV_MAX_PARSE_ATTEMPTS, parse_cv_async
+
+
+@pytest.fixture
+def employee():
+    user = User.objects.create_user(username="dev", password="123")
+    return Employee.objects.create(user=user)
+
+
+@pytest.fixture
+def cv_with_text(employee, monkeypatch, settings, tmp_path):
+    """CV row whose file "contains" the given text."""
+    settings.MEDIA_ROOT = tmp_path
+    (tmp_path / "cvs").mkdir()
+    (tmp_path / "cvs" / "dev.pdf").write_bytes(b"%PDF-1.4")
+
+    def make(text):
+        monkeypatch.setattr(
+            CVParser, "extract_text_from_pdf", staticmethod(lambda raw: text)
+        )
+        return CV.objects.create(employee=employee, file="cvs/dev.pdf")
+
+    return make
+
+
+@pytest.mark.django_db
+def test_parse_cv_async_upserts_extracted_skills(employee, cv_with_text):
+    Skill.objects.create(employee=employee, name="Python", source="MANUAL", confidence_score=1.0)
+    Skill.objects.create(employee=employee, name="Cobol", source="CV", confidence_score=0.9)
+    cv = cv_with_text("Skills:\nPython, Django, django, PostgreSQL")
+
+    assert parse_cv_async(cv.id) is True
+
+    skills = {s.name: s for s in Skill.objects.filter(employee=employee)}
+    assert "Cobol" not in skills
+    assert {"Python", "Django", "PostgreSQL"} <= set(skills)
+    assert skills["Python"].source == "CV"
+    assert skills["Python"].confidence_score < 1.0
+
+
+@pytest.mark.django_db
+def test_parse_cv_async_keeps_rows_for_skills_still_present(employee, cv_with_text):
+    kept = Skill.objects.create(employee=employee, name="Django", source="CV", confidence_score=0.1)
+    cv = cv_with_text("Skills:\nDjango")
+
+    assert parse_cv_async(cv.id) is True
+
+    kept.refresh_from_db()
+    assert kept.confidence_score > 0.1
+    assert [s.name for s in Skill.objects.filter(employee=employee)] == ["Django"]
+
+
+@pytest.mark.django_db
+def test_parse_cv_async_fails_missing_file_without_retrying(employee, settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    cv = CV.objects.create(employee=employee, file="cvs/missing.pdf")
+
+    # A missing file is permanent; retrying would only delay the failure
+    result = parse_cv_async.apply(args=[cv.id])
+    assert result.get() is False
+    assert result.state == "SUCCESS"
+
+    cv.refresh_from_db()
+    assert cv.status == "FAILED"
+    assert cv.parse_attempts == 0
+
+
+@pytest.mark.django_db
+def test_parse_cv_async_retries_transient_storage_errors(employee, cv_with_text, monkeypatch):
+    cv = cv_with_text("Skills:\nPython")
+    calls = []
+
+    def flaky_open(name, mode="rb"):
+        calls.append(name)
+        raise TimeoutError("storage timed out")
+
+    monkeypatch.setattr(cv.file.storage, "open", flaky_open)
+
+    with pytest.raises(Retry):
+        parse_cv_async.apply(args=[cv.id])
+    cv.refresh_from_db()
+    assert cv.status == "PROCESSING"
+
+    # Once retries run out the CV fails
+    result = parse_cv_async.apply(args=[cv.id], retries=parse_cv_async.max_retries)
+    assert result.get() is False
+    assert len(calls) == 2
+
+    cv.refresh_from_db()
+    assert cv.status == "FAILED"
+
+
+@pytest.mark.django_db
+def test_parse_cv_async_parses_redelivered_message_that_never_started(
+    employee, cv_with_text
+):
+    cv = cv_with_text("Skills:\nPython")
+    # upload_cv already marked it PROCESSING; no parse attempt has started
+    CV.objects.filter(id=cv.id).update(status="PROCESSING")
+
+    parse_cv_async.push_request(delivery_info={"redelivered": True})
+    try:
+        assert parse_cv_async.run(cv.id) is True
+    finally:
+        parse_cv_async.pop_request()
+
+    cv.refresh_from_db()
+    assert cv.status == "READY"
+    assert cv.parse_attempts == 0
+
+
+@pytest.mark.django_db
+def test_parse_cv_async_fails_cv_after_repeated_lost_attempts(employee, cv_with_text):
+    cv = cv_with_text("Skills:\nPython")
+    CV.objects.filter(id=cv.id).update(
+        status="PROCESSING", parse_attempts=CV_MAX_PARSE_ATTEMPTS
+    )
+
+    assert parse_cv_async(cv.id) is False
+
+    cv.refresh_from_db()
+    assert cv.status == "FAILED"
+    assert not Skill.objects.filter(employee=employee).exists()
@@ -0,0 +1,512 @@
+import io
+
+import docx
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework.test import APIClient
+
+from core.authentication import generate_jwt_token, user_cache_key
+from core.models import CV, Employee, Task, TaskAssignment, User
+from core.services.cv_parser import CVParser
+from core.services.match_service import MatchService
+from core.services.matching_engine import MatchingEngine
+from core.tasks import parse_cv_async, refresh_recommendations_async
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def pm():
+    return User.objects.create_user(username="pm", password="123", role="PM")
+
+
+@pytest.fixture
+def employee(pm):
+    user = User.objects.create_user(
+        username="dev", email="dev@example.com", password="123", role="EMPLOYEE"
+    )
+    return Employee.objects.create(user=user, manager=pm, title="Developer")
+
+
+def client_for(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.mark.django_db
+def test_my_profile_lists_active_and_completed_tasks(pm, employee):
+    active = Task.objects.create(title="Active", created_by=pm, status="ASSIGNED")
+    done = Task.objects.create(title="Done", created_by=pm, status="COMPLETED")
+    TaskAssignment.objects.create(task=active, employee=employee, suitability_score=70)
+    TaskAssignment.objects.create(
+        task=done, employee=employee, suitability_score=90, status="COMPLETED"
+    )
+
+    response = client_for(employee.user).get("/api/employees/my-profile/")
+
+    assert response.status_code == 200
+    tasks = {t["title"]: t for t in response.data["tasks"]}
+    assert tasks["Active"]["id"] == str(active.id)
+    assert tasks["Active"]["status"] == "ASSIGNED"
+    assert tasks["Done"]["suitability_score"] == 90
+    assert response.data["workload"] == 20.0
+
+
+@pytest.mark.django_db
+def test_pm_creates_employee_with_skills(pm, django_assert_max_num_queries):
+    # savepoints + user/employee/skill inserts + audit + skills and CV reads
+    with django_assert_max_num_queries(10):
+        response = client_for(pm).post(
+            "/api/employees/",
+            {"email": "new@example.com", "name": "New Hire", "skills": ["Python", "SQL"]},
+            format="json",
+        )
+
+    assert response.status_code == 201
+    assert sorted(response.data["skills"]) == ["Python", "SQL"]
+    assert response.data["current_workload"] == 0
+    assert response.data["assigned_tasks"] == []
+    assert User.objects.get(email="new@example.com").employee_profile.manager == pm
+
+
+@pytest.mark.django_db
+def test_dashboard_stats_are_cached_until_tasks_change(
+    pm, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    client = client_for(pm)
+    Task.objects.create(title="Open", created_by=pm, status="UNASSIGNED")
+
+    assert client.get("/api/dashboard/stats").data["unassigned_tasks"] == 1
+    with django_assert_num_queries(0):
+        assert client.get("/api/dashboard/stats").data["unassigned_tasks"] == 1
+
+    # Invalidation waits for the writer's commit
+    with django_capture_on_commit_callbacks(execute=True):
+        Task.objects.create(title="Another", created_by=pm, status="UNASSIGNED")
+        assert client.get("/api/dashboard/stats").data["unassigned_tasks"] == 1
+    assert client.get("/api/dashboard/stats").data["unassigned_tasks"] == 2
+
+
+@pytest.mark.django_db
+def test_dashboard_pm_workload_and_skills_coverage(
+    pm, employee, django_assert_num_queries
+):
+    other = User.objects.create_user(username="idle", password="123")
+    Employee.objects.create(user=other, manager=pm)
+    with_skills = Task.objects.create(title="Skilled", created_by=pm, status="ASSIGNED")
+    with_skills.task_skills.create(skill_name="Python")
+    with_skills.task_skills.create(skill_name="Django")
+    Task.objects.create(title="Bare", created_by=pm, status="UNASSIGNED")
+    TaskAssignment.objects.create(task=with_skills, employee=employee, suitability_score=75)
+
+    with django_assert_num_queries(2):  # employee workload + task counts
+        data = client_for(pm).get("/api/dashboard/stats").data
+
+    # One of two employees at 1/5 capacity -> (20 + 0) / 2
+    assert data["employee_capacity"] == 10.0
+    assert data["skills_coverage"] == 50.0
+    assert data["active_tasks"] == 1
+    assert data["unassigned_tasks"] == 1
+
+
+@pytest.mark.django_db
+def test_upload_cv_dispatches_parsing_after_commit(
+    pm, employee, monkeypatch, settings, tmp_path, django_capture_on_commit_callbacks
+):
+    settings.MEDIA_ROOT = tmp_path
+    dispatched = []
+    monkeypatch.setattr(CVParser, "is_valid_pdf", staticmethod(lambda f: True))
+    monkeypatch.setattr(parse_cv_async, "delay", lambda cv_id: dispatched.append(cv_id))
+
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        response = client_for(pm).post(
+            f"/api/employees/{employee.id}/cv/",
+            {"file": SimpleUploadedFile("cv.pdf", b"%PDF-1.4", "application/pdf")},
+        )
+
+    assert response.status_code == 200
+    assert dispatched == []
+    with employee.cv.file.open("rb") as stored:
+        assert stored.read() == b"%PDF-1.4"
+    for callback in callbacks:
+        callback()
+    assert dispatched == [employee.cv.id]
+
+
+@pytest.mark.django_db
+def test_upload_cv_rejects_oversized_file_before_reading(pm, employee, settings):
+    settings.CV_MAX_UPLOAD_SIZE = 4
+    upload = SimpleUploadedFile("cv.pdf", b"%PDF-1.4", "application/pdf")
+
+    response = client_for(pm).post(f"/api/employees/{employee.id}/cv/", {"file": upload})
+
+    assert response.status_code == 400
+    assert response.data["message"] == "File is too large (max 4\xa0bytes)"
+    assert not CV.objects.filter(employee=employee).exists()
+
+
+@pytest.mark.django_db
+def test_analyze_cv_extracts_details_from_docx(pm):
+    document = docx.Document()
+    document.add_paragraph("Jane Doe")
+    document.add_paragraph("jane.doe@example.com")
+    document.add_paragraph("Skills: Python, Django")
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    response = client_for(pm).post(
+        "/api/employees/analyze/",
+        {"file": SimpleUploadedFile("cv.docx", buffer.getvalue())},
+    )
+
+    assert response.status_code == 200
+    assert response.data["email"] == "jane.doe@example.com"
+    assert "Python" in response.data["skills"]
+
+
+def _make_employees(pm, start, count):
+    for i in range(start, start + count):
+        user = User.objects.create_user(username=f"bulk{i}", password="123")
+        emp = Employee.objects.create(user=user, manager=pm)
+        emp.skill_set.create(name="Python")
+        task = Task.objects.create(title=f"T{i}", created_by=pm, status="ASSIGNED")
+        task.task_skills.create(skill_name="Python")
+        TaskAssignment.objects.create(task=task, employee=emp, suitability_score=50)
+
+
+def _count_queries(client, url):
+    with CaptureQueriesContext(connection) as ctx:
+        assert client.get(url).status_code == 200
+    return len(ctx)
+
+
+@pytest.mark.django_db
+def test_list_endpoints_do_not_query_per_row(pm):
+    client = client_for(pm)
+    urls = ["/api/employees/", "/api/tasks/"]
+    _make_employees(pm, 0, 2)
+    before = [_count_queries(client, url) for url in urls]
+    _make_employees(pm, 2, 3)
+    assert [_count_queries(client, url) for url in urls] == before
+
+
+@pytest.mark.django_db
+def test_list_fields_param_trims_response(pm, employee):
+    data = client_for(pm).get("/api/employees/?fields=id,name").data
+    rows = data["results"] if isinstance(data, dict) else data
+    assert set(rows[0]) == {"id", "name"}
+
+
+@pytest.mark.django_db
+def test_login_by_email_or_username_with_single_lookup(
+    employee, django_assert_num_queries
+):
+    client = APIClient()
+    with django_assert_num_queries(1):
+        response = client.post(
+            "/api/auth/login",
+            {"email": "DEV@example.com", "password": "123"},
+            format="json",
+        )
+    assert response.status_code == 200
+    assert response.data["user"]["email"] == "dev@example.com"
+
+    assert client.post(
+        "/api/auth/login", {"email": "dev", "password": "123"}, format="json"
+    ).status_code == 200
+    assert client.post(
+        "/api/auth/login", {"email": "dev", "password": "wrong"}, format="json"
+    ).status_code == 401
+
+
+@pytest.mark.django_db
+def test_token_user_is_cached_until_profile_changes(
+    pm, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_jwt_token(pm)}")
+
+    assert client.get("/api/auth/login").status_code == 200
+    with django_assert_num_queries(0):
+        assert client.get("/api/auth/login").data["user"]["name"] == "pm"
+
+    cached = cache.get(user_cache_key(pm.id))
+    assert cached["role"] == "PM"
+    assert "password" not in cached
+
+    with django_capture_on_commit_callbacks(execute=True):
+        client.patch("/api/auth/login", {"name": "Pat Manager"}, format="json")
+    assert client.get("/api/auth/login").data["user"]["name"] == "Pat Manager"
+
+    # Saving the partially loaded cached user must not touch the password
+    pm.refresh_from_db()
+    assert pm.check_password("123")
+
+
+@pytest.mark.django_db
+def test_create_employee_relies_on_unique_constraints(pm, employee):
+    client = client_for(pm)
+
+    duplicate = client.post(
+        "/api/employees/", {"email": "DEV@example.com", "name": "Dup"}, format="json"
+    )
+    assert duplicate.status_code == 400
+    assert duplicate.data["message"] == "User with this email already exists"
+
+    # Same local part as the existing "dev" user -> suffixed username
+    created = client.post(
+        "/api/employees/", {"email": "dev@other.com", "name": "Other Dev"}, format="json"
+    )
+    assert created.status_code == 201
+    assert User.objects.get(email="dev@other.com").username.startswith("dev_")
+
+
+@pytest.mark.django_db
+def test_profile_patch_rejects_email_in_use(pm, employee):
+    response = client_for(pm).patch(
+        "/api/auth/login", {"email": "dev@example.com"}, format="json"
+    )
+    assert response.status_code == 400
+    assert response.data["message"] == "Email already in use"
+
+
+@pytest.mark.django_db
+def test_task_matches_cached_until_inputs_change(
+    pm, employee, monkeypatch, django_capture_on_commit_callbacks
+):
+    calls = []
+    monkeypatch.setattr(
+        MatchingEngine,
+        "find_best_matches",
+        lambda self, task, limit, min_score: calls.append(task.id) or [],
+    )
+    client = client_for(pm)
+    task = Task.objects.create(title="Match me", created_by=pm)
+    url = f"/api/tasks/{task.id}/matches/"
+
+    assert client.get(url).status_code == 200
+    assert client.get(url).status_code == 200
+    assert len(calls) == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        employee.skill_set.create(name="Python")
+    client.get(url)
+    assert len(calls) == 2
+
+    task.title = "Renamed"
+    task.save()
+    client.get(url)
+    assert len(calls) == 3
+
+
+def test_debug_media_listing_is_capped_and_debug_only(
+    client, settings, tmp_path, monkeypatch
+):
+    settings.MEDIA_ROOT = str(tmp_path)
+    (tmp_path / "cvs").mkdir()
+    for i in range(3):
+        (tmp_path / "cvs" / f"cv{i}.pdf").write_bytes(b"")
+    monkeypatch.setattr("itas.urls.DEBUG_MEDIA_MAX_ENTRIES", 2)
+
+    settings.DEBUG = True
+    data = client.get("/debug-media/").json()
+    assert len(data["Folder Contents"]) == 2
+    assert data["Truncated"] is True
+
+    settings.DEBUG = False
+    assert client.get("/debug-media/").status_code == 404
+
+
+@pytest.mark.django_db
+def test_list_querysets_skip_unrendered_text_columns(pm):
+    client = client_for(pm)
+    Task.objects.create(title="T", description="long text", created_by=pm)
+
+    with CaptureQueriesContext(connection) as ctx:
+        rows = client.get("/api/tasks/?fields=id,title").data
+    assert rows == [{"id": rows[0]["id"], "title": "T"}]
+    task_query = next(q["sql"] for q in ctx if 'FROM "core_task"' in q["sql"])
+    assert '"core_task"."description"' not in task_query
+
+    assert client.get("/api/tasks/").data[0]["description"] == "long text"
+
+
+@pytest.mark.django_db
+def test_employee_list_loads_only_rendered_columns(pm, employee):
+    employee.user.first_name = "Dana"
+    employee.user.save()
+    CV.objects.create(
+        employee=employee, file="cvs/dev.pdf", status="READY", extracted_text="x" * 100
+    )
+
+    with CaptureQueriesContext(connection) as ctx:
+        data = client_for(pm).get("/api/employees/").data
+    rows = data["results"] if isinstance(data, dict) else data
+    assert rows[0]["name"] == "Dana"
+    assert rows[0]["cvStatus"] == "READY"
+    employee_query = next(q["sql"] for q in ctx if 'FROM "core_employee"' in q["sql"])
+    assert '"password"' not in employee_query
+    assert '"extracted_text"' not in employee_query
+
+
+@pytest.mark.django_db
+def test_task_create_defers_matching_to_worker(
+    pm, monkeypatch, django_capture_on_commit_callbacks
+):
+    calls = []
+    monkeypatch.setattr(
+        MatchingEngine,
+        "find_best_matches",
+        lambda self, task, limit, min_score: calls.append(task.id) or [],
+    )
+    client = client_for(pm)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(
+            "/api/tasks/", {"title": "New", "requiredSkills": ["Python"]}, format="json"
+        )
+    assert response.status_code == 201
+    assert response.data["matches"] == []
+    assert len(calls) == 1  # computed by the eager Celery task after commit
+
+    client.get(f"/api/tasks/{response.data['id']}/matches/")
+    assert len(calls) == 1  # served from the cache the task populated
+
+
+@pytest.mark.django_db
+def test_task_matches_pending_while_worker_queued(pm, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        MatchingEngine,
+        "find_best_matches",
+        lambda self, task, limit, min_score: calls.append(task.id) or [],
+    )
+    client = client_for(pm)
+
+    # Outside a capture block the on_commit dispatch never runs, as if the
+    # worker had not picked the task up yet.
+    response = client.post(
+        "/api/tasks/", {"title": "New", "requiredSkills": ["Python"]}, format="json"
+    )
+    task_id = response.data["id"]
+
+    response = client.get(f"/api/tasks/{task_id}/matches/")
+    assert response.status_code == 202
+    assert response.data == {"pending": True}
+    assert calls == []
+
+    MatchService.clear_pending(task_id)
+    response = client.get(f"/api/tasks/{task_id}/matches/")
+    assert response.status_code == 200
+    assert calls == [task_id]
+
+
+@pytest.mark.django_db
+def test_task_create_skips_worker_without_shared_cache(pm, monkeypatch, settings):
+    # A real worker with a per-process cache could never hand results back
+    settings.CELERY_TASK_ALWAYS_EAGER = False
+    dispatched = []
+    monkeypatch.setattr(
+        refresh_recommendations_async, "delay", lambda task_id: dispatched.append(task_id)
+    )
+    client = client_for(pm)
+
+    response = client.post(
+        "/api/tasks/", {"title": "New", "requiredSkills": ["Python"]}, format="json"
+    )
+    assert response.status_code == 201
+    assert dispatched == []
+
+    response = client.get(f"/api/tasks/{response.data['id']}/matches/")
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_task_create_survives_broker_outage(
+    pm, monkeypatch, django_capture_on_commit_callbacks
+):
+    def broker_down(task_id):
+        raise ConnectionError("broker unavailable")
+
+    monkeypatch.setattr(refresh_recommendations_async, "delay", broker_down)
+    client = client_for(pm)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(
+            "/api/tasks/", {"title": "New", "requiredSkills": ["Python"]}, format="json"
+        )
+    assert response.status_code == 201
+
+    # No pending marker left behind: matches are computed on read
+    response = client.get(f"/api/tasks/{response.data['id']}/matches/")
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_reports_workload_uses_constant_queries(
+    pm, employee, django_capture_on_commit_callbacks
+):
+    task = Task.objects.create(title="Busy", created_by=pm, status="ASSIGNED")
+    TaskAssignment.objects.create(task=task, employee=employee, suitability_score=60)
+    client = client_for(pm)
+
+    before = _count_queries(client, "/api/reports")
+    with django_capture_on_commit_callbacks(execute=True):
+        _make_employees(pm, 0, 3)  # saves invalidate the cached report
+    assert _count_queries(client, "/api/reports") == before
+    assert _count_queries(client, "/api/reports") < before  # cached
+
+    data = client.get("/api/reports").data
+    assert data["task_stats"]["total"] == 4
+    assert data["task_stats"]["assigned"] == 4
+    workloads = {row["name"]: row["workload"] for row in data["workload_distribution"]}
+    assert workloads["dev"] == 20.0
+
+
+@pytest.mark.django_db
+def test_assign_task_replaces_previous_active_assignment(pm, employee):
+    other = Employee.objects.create(
+        user=User.objects.create_user(username="other", password="123"), manager=pm
+    )
+    task = Task.objects.create(title="T", created_by=pm, status="ASSIGNED")
+    TaskAssignment.objects.create(task=task, employee=other, suitability_score=40)
+    client = client_for(pm)
+
+    response = client.post(
+        f"/api/tasks/{task.id}/assign/", {"employee_id": employee.id}, format="json"
+    )
+
+    assert response.status_code == 200
+    statuses = dict(task.assignments.values_list("employee_id", "status"))
+    assert statuses == {other.id: "CANCELLED", employee.id: "ASSIGNED"}
+    assert client.post(
+        f"/api/tasks/{task.id}/assign/", {"employee_id": 9999}, format="json"
+    ).status_code == 404
+
+
+@pytest.mark.django_db
+def test_employee_task_list_shows_only_assigned_tasks(pm, employee):
+    mine = Task.objects.create(title="Mine", created_by=pm, status="ASSIGNED")
+    Task.objects.create(title="Theirs", created_by=pm, status="UNASSIGNED")
+    TaskAssignment.objects.create(task=mine, employee=employee, suitability_score=60)
+    TaskAssignment.objects.create(
+        task=mine,
+        employee=Employee.objects.create(
+            user=User.objects.create_user(username="other", password="123")
+        ),
+        suitability_score=10,
+        status="CANCELLED",
+    )
+
+    rows = client_for(employee.user).get("/api/tasks/?fields=id,title").data
+
+    assert rows == [{"id": mine.id, "title": "Mine"}]
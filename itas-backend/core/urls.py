@@ -9,8 +9,7 @@ from rest_framework.response import Response
 from rest_framework.routers import DefaultRouter
 
 from core.views import (AuthView, DashboardView, EmployeeViewSet,
-                        ProjectViewSet, ReportsView, TaskViewSet, debug_email,
-                        debug_media)
+                        ProjectViewSet, ReportsView, TaskViewSet, debug_email)
 
 router = DefaultRouter()
 router.register(r"employees", EmployeeViewSet, basename="employee")
@@ -44,7 +43,6 @@ urlpatterns = [
     path("", api_root, name="api-root"),
     path("auth/login", AuthView.as_view(), name="auth-login"),
     path("dashboard/stats", DashboardView.as_view(), name="dashboard-stats"),
-    path("debug-media", debug_media, name="debug-media"),
     path("debug-email", debug_email, name="debug-email"),
     path("reports", ReportsView.as_view(), name="reports"),
     path("", include(router.urls)),
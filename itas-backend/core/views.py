@@ -1,1251 +0,0 @@
-"""
-API Views for ITAS
-"""
-
-import threading
-
-from django.contrib.auth import authenticate, get_user_model
-from django.db import transaction
-from django.db.models import Q
-from django.utils import timezone
-from rest_framework import exceptions, status, viewsets
-from rest_framework.decorators import action, api_view, permission_classes
-from rest_framework.permissions import AllowAny
-from rest_framework.response import Response
-from rest_framework.views import APIView
-
-from core.authentication import generate_jwt_token
-from core.models import CV, Employee, Project, Skill, Task, TaskAssignment, TaskSkillEvaluation
-from core.serializers import (DashboardStatsSerializer, EmployeeSerializer,
-                              ProjectSerializer, TaskAssignmentSerializer,
-                              TaskMatchSerializer, TaskSerializer,
-                              UserSerializer)
-from core.services.audit_service import AuditService
-from core.services.cv_parser import CVParser
-from core.services.matching_engine import MatchingEngine
-from core.services.skill_extractor import SkillExtractor
-
-User = get_user_model()
-
-
-class AuthView(APIView):
-    """Authentication endpoints."""
-
-    permission_classes = [AllowAny]
-    # authentication_classes default to settings (JWT) which is fine for login as it handles Anonymous
-
-    def get(self, request):
-        """Verify token and return current user."""
-        if not request.user.is_authenticated:
-            return Response(
-                {"message": "Invalid or expired token"},
-                status=status.HTTP_401_UNAUTHORIZED,
-            )
-
-        user_serializer = UserSerializer(request.user)
-        user_data = user_serializer.data
-        user_data["id"] = str(user_data["id"])
-
-        return Response({"user": user_data})
-
-    def post(self, request):
-        """Login endpoint."""
-        email_or_username = (request.data.get("email") or "").strip()
-        password = (request.data.get("password") or "").strip()
-
-        if not email_or_username or not password:
-            return Response(
-                {"message": "Please provide both email/username and password"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # 1. Try to find user by email or username
-        user = User.objects.filter(
-            Q(email__iexact=email_or_username) | Q(username__iexact=email_or_username)
-        ).first()
-
-        if not user:
-            return Response(
-                {"message": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED
-            )
-
-        # Use Django's authenticate to respect auth backends properly
-        # Some projects authenticate with username, not email.
-        authed = authenticate(request, username=user.username, password=password)
-
-        if not authed:
-            return Response(
-                {"message": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED
-            )
-
-        # Generate token
-        token = generate_jwt_token(authed)
-
-        # Serialize user
-        user_serializer = UserSerializer(authed)
-        user_data = user_serializer.data
-        user_data["id"] = str(user_data["id"])  # frontend compatibility
-
-        return Response({"token": token, "user": user_data}, status=status.HTTP_200_OK)
-
-    def patch(self, request):
-        """Update current user profile (Name, Email, Password)."""
-        if not request.user.is_authenticated:
-            return Response(
-                {"message": "Authentication required"},
-                status=status.HTTP_401_UNAUTHORIZED,
-            )
-
-        user = request.user
-        data = request.data
-
-        # Update Name
-        if "name" in data:
-            name_parts = data["name"].strip().split()
-            user.first_name = name_parts[0] if name_parts else ""
-            user.last_name = " ".join(name_parts[1:]) if len(name_parts) > 1 else ""
-
-        # Update Email
-        if "email" in data:
-            new_email = data["email"].strip().lower()
-            if new_email and new_email != user.email:
-                if User.objects.filter(email=new_email).exclude(id=user.id).exists():
-                    return Response(
-                        {"message": "Email already in use"},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-                user.email = new_email
-
-        # Update Password
-        if "password" in data:
-            new_password = data["password"].strip()
-            if len(new_password) < 6:
-                return Response(
-                    {"message": "Password must be at least 6 characters"},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-            user.set_password(new_password)
-
-        user.save()
-
-        # Serialize updated user
-        user_serializer = UserSerializer(user)
-        user_data = user_serializer.data
-        user_data["id"] = str(user_data["id"])
-
-        return Response({"user": user_data, "message": "Profile updated successfully"})
-
-
-class ReportsView(APIView):
-    """View for generating system reports."""
-
-    def get(self, request):
-        if request.user.role != "PM":
-            return Response(
-                {"message": "Only Project Managers can view reports"},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        user = request.user
-
-        # 1. Task Allocation Stats — scoped to this PM's tasks
-        pm_tasks = Task.objects.filter(created_by=user)
-        total_tasks = pm_tasks.count()
-        completed = pm_tasks.filter(status="COMPLETED").count()
-        assigned = pm_tasks.filter(status="ASSIGNED").count()
-
-        # 2. Workload Distribution — scoped to this PM's employees
-        employees = Employee.objects.filter(manager=user)
-        workload_data = [
-            {"name": e.name, "workload": e.current_workload, "title": e.title}
-            for e in employees
-        ]
-
-        # 3. Assignment History (last 30 days) — scoped to this PM's tasks
-        last_30_days = timezone.now() - timezone.timedelta(days=30)
-        assignments = TaskAssignment.objects.filter(
-            assigned_at__gte=last_30_days, task__created_by=user
-        ).count()
-
-        return Response(
-            {
-                "task_stats": {
-                    "total": total_tasks,
-                    "completed": completed,
-                    "assigned": assigned,
-                    "completion_rate": round(
-                        (completed / total_tasks * 100) if total_tasks else 0, 1
-                    ),
-                },
-                "workload_distribution": workload_data,
-                "recent_assignments": assignments,
-            }
-        )
-
-
-class EmployeeViewSet(viewsets.ModelViewSet):
-    """Employee endpoints."""
-
-    queryset = Employee.objects.all()
-    serializer_class = EmployeeSerializer
-
-    def get_queryset(self):
-        """Filter employees based on user role."""
-        user = self.request.user
-        queryset = Employee.objects.select_related("user", "manager").prefetch_related(
-            "skill_set"
-        )
-
-        if user.role == "EMPLOYEE":
-            # Employees can only see their own profile
-            employee = getattr(user, "employee_profile", None)
-            if employee:
-                queryset = queryset.filter(id=employee.id)
-            else:
-                queryset = queryset.none()
-        else:
-            # PMs see only their managed employees
-            queryset = queryset.filter(manager=user)
-
-        # Apply optional filters
-        team = self.request.query_params.get("team")
-        role = self.request.query_params.get("role")
-        title = self.request.query_params.get("title")
-
-        if team:
-            queryset = queryset.filter(team__icontains=team)
-        if role:
-            queryset = queryset.filter(role__icontains=role)
-        if title:
-            queryset = queryset.filter(title__icontains=title)
-
-        return queryset
-
-    def create(self, request, *args, **kwargs):
-        """Create new employee and associated user."""
-        # Check permissions (only PM can create employees)
-        if request.user.role != "PM":
-            return Response(
-                {"message": "Only Project Managers can add employees"},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        data = request.data
-        email = data.get("email")
-        name = data.get("name")
-        title = data.get("title")
-
-        if not email or not name:
-            return Response(
-                {"message": "Email and name are required"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # Check if user exists
-        if User.objects.filter(email=email).exists():
-            return Response(
-                {"message": "User with this email already exists"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        try:
-            with transaction.atomic():
-                # Create User
-                username = email.split("@")[0]
-                # Ensure unique username
-                if User.objects.filter(username=username).exists():
-                    import uuid
-
-                    username = f"{username}_{uuid.uuid4().hex[:4]}"
-
-                import secrets
-                import string
-
-                random_password = "".join(
-                    secrets.choice(string.ascii_letters + string.digits)
-                    for _ in range(12)
-                )
-                user = User.objects.create_user(
-                    username=username,
-                    email=email,
-                    password=random_password,
-                    first_name=name.split(" ")[0],
-                    last_name=" ".join(name.split(" ")[1:]) if " " in name else "",
-                    role="EMPLOYEE",
-                )
-
-                # Create Employee
-                employee = Employee.objects.create(
-                    user=user,
-                    manager=request.user,  # Assign current PM as manager
-                    title=title,
-                    email=email,
-                )
-
-                # Add initial skills if provided
-                skills = data.get("skills", [])
-                if skills and isinstance(skills, list):
-                    for skill_name in skills:
-                        Skill.objects.create(
-                            employee=employee,
-                            name=skill_name,
-                            source="MANUAL",  # Created via form (even if auto-filled)
-                            confidence_score=1.0,
-                        )
-
-                serializer = self.get_serializer(employee)
-                AuditService.log(
-                    request.user, "CREATE", employee, f"Created employee {email}"
-                )
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-
-        except Exception as e:
-            return Response({"message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
-
-    def perform_destroy(self, instance):
-        """Delete employee and associated user."""
-        if self.request.user.role != "PM":
-            raise exceptions.PermissionDenied(
-                "Only Project Managers can remove employees."
-            )
-
-        user = instance.user
-        instance.delete()
-        AuditService.log(
-            self.request.user, "DELETE", instance, f"Deleted employee {user.email}"
-        )
-        user.delete()
-
-    @action(detail=False, methods=["post"], url_path="analyze")
-    def analyze_cv(self, request):
-        """
-        Analyze a CV file and return extracted details (Name, Email, Title)
-        for pre-filling the employee creation form.
-        """
-        if "file" not in request.FILES:
-            return Response(
-                {"message": "No file provided"}, status=status.HTTP_400_BAD_REQUEST
-            )
-
-        file = request.FILES["file"]
-
-        # Parse PDF
-        parser = CVParser()
-        is_pdf = parser.is_valid_pdf(file)
-        is_docx = parser.is_valid_docx(file)
-
-        if not (is_pdf or is_docx):
-            return Response(
-                {"message": "Only PDF and DOCX files are supported"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # Read file
-        if hasattr(file, "read"):
-            file_content = file.read()
-            file.seek(0)
-        else:
-            file_content = file
-
-        try:
-            extracted_text = ""
-            if is_pdf:
-                extracted_text = parser.extract_text_from_pdf(file)
-            elif is_docx:
-                extracted_text = parser.extract_text_from_docx(file)
-
-            if not extracted_text:
-                raise ValueError("Could not extract text")
-
-        except Exception as e:
-            return Response(
-                {"message": f"Error parsing file: {str(e)}"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # Extract details using parser logic
-        details = parser.extract_details(extracted_text)
-
-        # Fallback to AI prediction for role
-        if not details["role"]:
-            predicted_role = parser.predict_role_with_ai(extracted_text)
-            if predicted_role:
-                details["role"] = predicted_role
-
-        # Basic Email Extraction
-        import re
-
-        email_match = re.search(r"[\w\.-]+@[\w\.-]+\.\w+", extracted_text)
-        if email_match:
-            details["email"] = email_match.group(0)
-        else:
-            details["email"] = ""
-
-        # Extract Skills
-        try:
-            extractor = SkillExtractor()
-            
-            # Clean spacing for better extraction
-            import re
-            cleaned_text = extracted_text
-            if re.search(r"\b([A-Za-z]\s){2,}[A-Za-z]\b", cleaned_text):
-                cleaned_text = re.sub(r"([A-Za-z])\s(?=[A-Za-z]\b)", r"\1", cleaned_text)
-            cleaned_text = re.sub(r"\b([A-Za-z])\s([A-Za-z]{3,})\b", r"\1\2", cleaned_text)
-            
-            skills_data = extractor.extract_skills(cleaned_text)
-            details["skills"] = [s["name"] for s in skills_data]
-            
-            with open("debug_skills.log", "w") as f:
-                f.write(f"TEXT:\n{cleaned_text[:1000]}\n\nSKILLS:\n{details['skills']}")
-        except Exception as e:
-            print(f"Error extracting skills in analyze_cv: {e}")
-            with open("debug_skills.log", "w") as f:
-                f.write(f"ERROR:\n{e}")
-            details["skills"] = []
-
-        return Response(details)
-
-    @action(detail=True, methods=["post"], url_path="cv")
-    def upload_cv(self, request, pk=None):
-        """Upload CV for employee."""
-        employee = self.get_object()
-
-        if "file" not in request.FILES:
-            return Response(
-                {"message": "No file provided"}, status=status.HTTP_400_BAD_REQUEST
-            )
-
-        file = request.FILES["file"]
-
-        # Validate file type
-        if not (
-            file.name.lower().endswith(".pdf") or file.name.lower().endswith(".docx")
-        ):
-            return Response(
-                {"message": "Only PDF and DOCX files are supported"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # Validate File Content
-        parser = CVParser()
-        is_pdf = parser.is_valid_pdf(file)
-        is_docx = parser.is_valid_docx(file)
-
-        if not (is_pdf or is_docx):
-            return Response(
-                {"message": "Invalid file content"}, status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # Create or update CV record
-        cv, created = CV.objects.get_or_create(employee=employee)
-        cv.file = file
-        cv.status = "PROCESSING"
-        cv.error_message = None
-        cv.save()
-
-        # Process CV in background thread
-        def process_cv():
-            try:
-                cv.refresh_from_db()
-                with cv.file.open("rb") as f:
-                    file_content = f.read()
-                    f.seek(0)
-
-                    # Determine type again or store it - simpler to re-check or check extension
-                    # Since we validated on upload, we can check byte signature or just try both
-                    # Or check extension from file name if available
-
-                    extracted_text = None
-                    if cv.file.name.lower().endswith(".pdf") and parser.is_valid_pdf(f):
-                        f.seek(0)
-                        extracted_text = parser.extract_text_from_pdf(f)
-                    elif cv.file.name.lower().endswith(".docx"):
-                        # is_valid_docx checks but we can just try extract
-                        f.seek(0)
-                        extracted_text = parser.extract_text_from_docx(f)
-                    else:
-                        # Fallback try both
-                        f.seek(0)
-                        if parser.is_valid_pdf(f):
-                            f.seek(0)
-                            extracted_text = parser.extract_text_from_pdf(f)
-                        else:
-                            f.seek(0)
-                            extracted_text = parser.extract_text_from_docx(f)
-
-                if not extracted_text:
-                    cv.status = "FAILED"
-                    cv.error_message = "Could not extract text from PDF"
-                    cv.save()
-                    return
-
-                cv.extracted_text = extracted_text
-                cv.status = "READY"
-                cv.processed_at = timezone.now()
-                cv.save()
-
-                extractor = SkillExtractor()
-                skills_data = extractor.extract_skills(extracted_text)
-
-                with transaction.atomic():
-                    Skill.objects.filter(employee=employee, source="CV").delete()
-
-                    for skill_data in skills_data:
-                        skill_name = extractor.normalize_skill_name(skill_data["name"])
-                        Skill.objects.update_or_create(
-                            employee=employee,
-                            name=skill_name,
-                            defaults={
-                                "source": "CV",
-                                "confidence_score": skill_data["confidence_score"],
-                            },
-                        )
-
-                    # Extract and update details
-                    details = parser.extract_details(extracted_text)
-
-                    # Fallback to AI prediction for role if heuristic failed
-                    if not details["role"]:
-                        predicted_role = parser.predict_role_with_ai(extracted_text)
-                        if predicted_role:
-                            details["role"] = predicted_role
-
-                    # Update Title if found
-                    if details["role"] and (
-                        not employee.title or employee.title.startswith("New Employee")
-                    ):
-                        employee.title = details["role"]
-                        employee.save()
-
-                    # Update Name if found
-                    if details["name"]:
-                        user = employee.user
-                        current_name = f"{user.first_name} {user.last_name}".strip()
-                        # Only update if name looks generic or is just email
-                        if (
-                            not current_name
-                            or "@" in current_name
-                            or current_name.lower().startswith("new user")
-                        ):
-                            name_parts = details["name"].split()
-                            user.first_name = name_parts[0]
-                            user.last_name = (
-                                " ".join(name_parts[1:]) if len(name_parts) > 1 else ""
-                            )
-                            user.save()
-
-            except Exception as e:
-                cv.status = "FAILED"
-                cv.error_message = str(e)
-                cv.save()
-
-        thread = threading.Thread(target=process_cv)
-        thread.daemon = True
-        thread.start()
-
-        return Response(
-            {"message": "CV uploaded and processing started", "status": "PROCESSING"}
-        )
-
-    @action(detail=False, methods=["get"], url_path="my-profile")
-    def get_my_profile(self, request):
-        """Get current employee's profile and tasks."""
-        user = request.user
-
-        if user.role != "EMPLOYEE":
-            return Response(
-                {"message": "This endpoint is only for employees"},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        employee = getattr(user, "employee_profile", None)
-        if not employee:
-            return Response(
-                {"message": "Employee profile not found"},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        employee_data = EmployeeSerializer(employee).data
-
-        active_assignments = TaskAssignment.objects.filter(
-            employee=employee, status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED"]
-        ).select_related("task")
-
-        completed_assignments = TaskAssignment.objects.filter(
-            employee=employee, status="COMPLETED"
-        ).select_related("task").order_by("-completed_at")[:5]
-
-        tasks_data = []
-        for assignment in list(active_assignments) + list(completed_assignments):
-            task = assignment.task
-            tasks_data.append(
-                {
-                    "id": str(task.id),
-                    "title": task.title,
-                    "description": task.description,
-                    "status": assignment.status,
-                    "priority": task.priority,
-                    "suitability_score": assignment.suitability_score,
-                    "due_date": task.due_date.isoformat() if task.due_date else None,
-                }
-            )
-
-        return Response(
-            {
-                "employee": employee_data,
-                "tasks": tasks_data,
-                "workload": employee.current_workload,
-            }
-        )
-
-    @action(detail=True, methods=["get"], url_path="performance-profile")
-    def get_performance_profile(self, request, pk=None):
-        """Get employee's detailed performance history and aggregated metrics."""
-        employee = self.get_object()
-        
-        completed_assignments = TaskAssignment.objects.filter(
-            employee=employee, status="COMPLETED"
-        ).select_related("task", "task__project").prefetch_related("skill_evaluations").order_by("completed_at")
-        
-        history = []
-        skill_scores = {}
-        total_rating = 0
-        rated_tasks_count = 0
-        
-        for a in completed_assignments:
-            task = a.task
-            
-            for eval in a.skill_evaluations.all():
-                key = eval.skill_name.lower().strip()
-                if key not in skill_scores:
-                    skill_scores[key] = {
-                        "name": eval.skill_name,
-                        "scores": []
-                    }
-                skill_scores[key]["scores"].append(eval.achieved_level)
-                
-            if a.performance_rating:
-                total_rating += a.performance_rating
-                rated_tasks_count += 1
-                
-            history.append({
-                "assignment_id": str(a.id),
-                "task_id": str(task.id),
-                "task_title": task.title,
-                "task_description": task.description,
-                "project_name": task.project.title if task.project else None,
-                "start_date": task.start_date.isoformat() if task.start_date else None,
-                "end_date": a.completed_at.isoformat() if a.completed_at else None,
-                "task_type": getattr(task, "task_type", None),
-                "complexity_level": getattr(task, "complexity_level", None),
-                "performance_rating": a.performance_rating,
-                "pm_comments": a.performance_comments,
-                "skill_evaluations": [
-                    {
-                        "skill_name": eval.skill_name,
-                        "required_level": eval.required_level,
-                        "achieved_level": eval.achieved_level,
-                        "pm_comment": eval.pm_comment
-                    } for eval in a.skill_evaluations.all()
-                ]
-            })
-            
-        # Get base static skills
-        base_skills = {}
-        for skill in employee.skill_set.all():
-            confidence = max(0.0, min(1.0, skill.confidence_score or 0.0))
-            if getattr(skill, "source", None) == "MANUAL":
-                confidence = max(confidence, 0.9)
-            base_skills[skill.name.lower().strip()] = {
-                "name": skill.name,
-                "score": max(1.0, confidence * 5.0)
-            }
-
-        weighted_average_skill_score_per_skill = {}
-        for key, data in base_skills.items():
-            weighted_average_skill_score_per_skill[data["name"]] = data["score"]
-            
-        for key, data in skill_scores.items():
-            weighted_average_skill_score_per_skill[data["name"]] = sum(data["scores"])/len(data["scores"])
-            
-        skill_analytics = []
-        for key, data in base_skills.items():
-            if key in skill_scores:
-                scores = skill_scores[key]["scores"]
-                skill_analytics.append({
-                    "skill_name": data["name"],
-                    "score": round(sum(scores)/len(scores), 1),
-                    "tasks_used": len(scores)
-                })
-            else:
-                skill_analytics.append({
-                    "skill_name": data["name"],
-                    "score": round(data["score"], 1),
-                    "tasks_used": 0
-                })
-                
-        for key, data in skill_scores.items():
-            if key not in base_skills:
-                scores = data["scores"]
-                skill_analytics.append({
-                    "skill_name": data["name"],
-                    "score": round(sum(scores)/len(scores), 1),
-                    "tasks_used": len(scores)
-                })
-                
-        skill_analytics.sort(key=lambda x: (x["tasks_used"], x["score"]), reverse=True)
-        
-        # Skill progression over time
-        skill_progression = {}
-        for key, data in skill_scores.items():
-            scores = data["scores"]
-            name = data["name"]
-            if len(scores) > 1:
-                trend = "IMPROVING" if scores[-1] > scores[0] else "DECLINING" if scores[-1] < scores[0] else "STABLE"
-            else:
-                trend = "INSUFFICIENT_DATA"
-            skill_progression[name] = trend
-            
-        # Consistency score (variance)
-        consistency_score = 100
-        if rated_tasks_count > 1:
-            avg_rating = total_rating / rated_tasks_count
-            variance = sum((a.performance_rating - avg_rating) ** 2 for a in completed_assignments if a.performance_rating) / rated_tasks_count
-            # scale variance (0-25) into a 0-100 score where lower variance = higher consistency
-            consistency_score = max(0, 100 - (variance * 20))
-            
-        reliability_index = 0
-        total_assigned = TaskAssignment.objects.filter(employee=employee).count()
-        if rated_tasks_count > 0 and total_assigned > 0:
-            avg_rating = total_rating / rated_tasks_count
-            completion_rate = completed_assignments.count() / total_assigned
-            reliability_index = (avg_rating / 5.0) * completion_rate * 100
-            
-        return Response({
-            "employee_id": str(employee.id),
-            "employee_name": employee.name,
-            "metrics": {
-                "weighted_average_skill_score": weighted_average_skill_score_per_skill,
-                "skill_analytics": skill_analytics,
-                "skill_progression": skill_progression,
-                "consistency_score": round(consistency_score, 2),
-                "reliability_index": round(reliability_index, 2),
-                "total_completed_tasks": completed_assignments.count(),
-                "rated_tasks_count": rated_tasks_count,
-            },
-            "task_history": history
-        })
-
-
-class ProjectViewSet(viewsets.ModelViewSet):
-    """Project endpoints."""
-
-    queryset = Project.objects.all()
-    serializer_class = ProjectSerializer
-
-    def get_queryset(self):
-        """Filter projects based on user role."""
-        user = self.request.user
-        queryset = Project.objects.select_related("manager")
-
-        if user.role == "PM":
-            # PMs see only their projects
-            queryset = queryset.filter(manager=user)
-        else:
-            # Employees - what should they see? All active projects?
-            # Or projects they have tasks in?
-            # For now, let's say Employees see active projects to know what's going on.
-            if self.action == "list":
-                queryset = queryset.filter(status="ACTIVE")
-            else:
-                # Can only see details, not edit
-                pass
-
-        return queryset
-
-    def perform_create(self, serializer):
-        """Create project with current user as manager."""
-        serializer.save(manager=self.request.user)
-
-
-class TaskViewSet(viewsets.ModelViewSet):
-    """Task endpoints."""
-
-    queryset = Task.objects.all()
-    serializer_class = TaskSerializer
-    pagination_class = None  # Disable pagination for now, return all results
-
-    def get_queryset(self):
-        """Filter tasks based on user role."""
-        user = self.request.user
-        queryset = Task.objects.select_related(
-            "created_by", "project"
-        ).prefetch_related("task_skills")
-
-        if user.role == "EMPLOYEE":
-            employee = getattr(user, "employee_profile", None)
-            if employee:
-                assigned_task_ids = TaskAssignment.objects.filter(
-                    employee=employee
-                ).values_list("task_id", flat=True)
-                queryset = queryset.filter(id__in=assigned_task_ids)
-        else:
-            # PMs see only tasks they created
-            queryset = queryset.filter(created_by=user)
-
-        return queryset.order_by("-created_at")
-
-    def create(self, request, *args, **kwargs):
-        """Create task and return matches."""
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
-
-        AuditService.log(request.user, "CREATE", serializer.instance, "Created task")
-
-        # Get the created task instance
-        task = serializer.instance
-
-        # Calculate matches
-        engine = MatchingEngine()
-        matches = engine.find_best_matches(task, limit=5, min_score=40.0)
-
-        # Serialize response
-        response_data = serializer.data
-        response_data["matches"] = matches
-
-        headers = self.get_success_headers(serializer.data)
-        return Response(response_data, status=status.HTTP_201_CREATED, headers=headers)
-
-    def perform_create(self, serializer):
-        """Create task with current user as creator."""
-        serializer.save(created_by=self.request.user)
-
-    @action(detail=False, methods=["post"], url_path="analyze")
-    def analyze_document(self, request):
-        """Analyze uploaded document to extract task details."""
-        if "file" not in request.FILES:
-            return Response(
-                {"message": "No file provided"}, status=status.HTTP_400_BAD_REQUEST
-            )
-
-        file = request.FILES["file"]
-
-        # Parse PDF
-        # Parse Document
-        parser = CVParser()  # Valid for generic docs too
-
-        is_pdf = parser.is_valid_pdf(file)
-        is_docx = parser.is_valid_docx(file)
-
-        extracted_text = None
-
-        if is_pdf:
-            extracted_text = parser.extract_text_from_pdf(file)
-        elif is_docx:
-            extracted_text = parser.extract_text_from_docx(file)
-        else:
-            return Response(
-                {"message": "Only PDF and DOCX files are supported"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        if not extracted_text:
-            return Response(
-                {"message": "Could not extract text from document"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # Extract details
-        details = parser.extract_task_details(extracted_text)
-
-        # Extract Skills using SkillExtractor
-        extractor = SkillExtractor()
-        skills_data = extractor.extract_skills(extracted_text)
-        details["requiredSkills"] = [
-            extractor.normalize_skill_name(s["name"]) for s in skills_data
-        ]
-
-        return Response(details)
-
-    @action(detail=True, methods=["get"], url_path="matches")
-    def get_matches(self, request, pk=None):
-        """Get recommended employee matches for a task."""
-        task = self.get_object()
-
-        engine = MatchingEngine()
-        matches = engine.find_best_matches(task, limit=10, min_score=50.0)
-
-        serializer = TaskMatchSerializer(matches, many=True)
-        return Response(serializer.data)
-
-    @action(detail=True, methods=["post"], url_path="assign")
-    def assign_task(self, request, pk=None):
-        """Assign task to an employee."""
-        task = self.get_object()
-        employee_id = request.data.get("employee_id")
-
-        if not employee_id:
-            return Response(
-                {"message": "employee_id is required"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        try:
-            employee = Employee.objects.get(id=employee_id)
-        except Employee.DoesNotExist:
-            return Response(
-                {"message": "Employee not found"}, status=status.HTTP_404_NOT_FOUND
-            )
-
-        engine = MatchingEngine()
-        score = engine.calculate_suitability_score(employee, task, task.required_skills)
-
-        active_statuses = ["ASSIGNED", "IN_PROGRESS", "BLOCKED"]
-
-        with transaction.atomic():
-            TaskAssignment.objects.filter(
-                task=task, status__in=active_statuses
-            ).exclude(employee=employee).update(status="CANCELLED")
-
-            assignment, created = TaskAssignment.objects.get_or_create(
-                task=task,
-                employee=employee,
-                defaults={"suitability_score": score, "status": "ASSIGNED"},
-            )
-
-            if not created:
-                assignment.suitability_score = score
-                # If reactivating an old assignment (or even if already active),
-                # update the timestamp so it appears as the most recent.
-                assignment.status = "ASSIGNED"
-                assignment.assigned_at = timezone.now()
-                assignment.save()
-
-            task.status = "ASSIGNED"
-            task.save()
-
-        AuditService.log(
-            request.user,
-            "ASSIGN",
-            task,
-            f"Assigned to {employee.name} with score {score}",
-        )
-
-        serializer = TaskAssignmentSerializer(assignment)
-        return Response(serializer.data)
-
-    @action(detail=True, methods=["post"], url_path="unassign")
-    def unassign_task(self, request, pk=None):
-        """Unassign task from current employee."""
-        task = self.get_object()
-
-        with transaction.atomic():
-            TaskAssignment.objects.filter(
-                task=task, status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED"]
-            ).update(status="CANCELLED")
-
-            task.status = "UNASSIGNED"
-            task.save()
-
-        AuditService.log(request.user, "UPDATE", task, "Unassigned task")
-
-        return Response({"message": "Task unassigned successfully"})
-
-    @action(detail=True, methods=["post"], url_path="progress")
-    def update_progress(self, request, pk=None):
-        """Update task progress (Status and Notes) for Employee."""
-        task = self.get_object()
-        user = request.user
-
-        # Find assignment for this user
-        try:
-            employee = user.employee_profile
-            assignment = TaskAssignment.objects.get(task=task, employee=employee)
-        except (AttributeError, TaskAssignment.DoesNotExist):
-            return Response(
-                {"message": "You are not assigned to this task"},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        new_status = request.data.get("status")
-        notes = request.data.get("notes")
-
-        if new_status:
-            # Update assignment status
-            assignment.status = new_status
-
-            # Sync to Task status if needed (simplified logic)
-            if new_status == "COMPLETED":
-                task.status = "COMPLETED"
-                assignment.completed_at = timezone.now()
-            elif new_status == "IN_PROGRESS":
-                task.status = "IN_PROGRESS"
-                if not assignment.started_at:
-                    assignment.started_at = timezone.now()
-
-            task.save()
-
-        if notes is not None:
-            assignment.notes = notes
-
-        assignment.save()
-
-        AuditService.log(user, "UPDATE", task, f"Updated progress: {new_status}")
-
-        return Response({"message": "Progress updated"})
-
-    @action(detail=True, methods=["post"], url_path="rate-performance")
-    def rate_performance(self, request, pk=None):
-        """Rate employee performance with detailed metrics for a completed task (PM only)."""
-        task = self.get_object()
-        user = request.user
-
-        if user.role != "PM":
-            return Response(
-                {"message": "Only Project Managers can rate performance"},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        data = request.data
-
-        try:
-            quality = int(data.get("quality_rating", 0))
-            timeliness = int(data.get("timeliness_rating", 0))
-            communication = int(data.get("communication_rating", 0))
-            technical = int(data.get("technical_rating", 0))
-
-            for r in [quality, timeliness, communication, technical]:
-                if r < 1 or r > 5:
-                    raise ValueError("Ratings must be between 1 and 5")
-
-        except (TypeError, ValueError) as e:
-            return Response(
-                {
-                    "message": (
-                        str(e)
-                        if str(e)
-                        else "Ratings must be valid integers between 1 and 5"
-                    )
-                },
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        comments = data.get("performance_comments", "")
-        overall_rating = (quality + timeliness + communication + technical) / 4.0
-
-        # Find the most recent active/completed assignment
-        assignment = (
-            TaskAssignment.objects.filter(task=task).order_by("-assigned_at").first()
-        )
-        if not assignment:
-            return Response(
-                {"message": "No assignment found for this task"},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        assignment.quality_rating = quality
-        assignment.timeliness_rating = timeliness
-        assignment.communication_rating = communication
-        assignment.technical_rating = technical
-        assignment.performance_comments = comments
-        assignment.performance_rating = overall_rating
-        assignment.save()
-        
-        skill_evaluations = data.get("skill_evaluations", [])
-        if skill_evaluations:
-            with transaction.atomic():
-                assignment.skill_evaluations.all().delete()
-                for eval_data in skill_evaluations:
-                    TaskSkillEvaluation.objects.create(
-                        assignment=assignment,
-                        skill_name=eval_data.get("skill_name", "Unknown"),
-                        required_level=int(eval_data.get("required_level", 3)),
-                        achieved_level=int(eval_data.get("achieved_level", 3)),
-                        pm_comment=eval_data.get("pm_comment", "")
-                    )
-
-        AuditService.log(
-            user, "UPDATE", task, f"Rated performance detailed: {overall_rating}/5"
-        )
-
-        return Response(
-            {
-                "message": "Performance rating saved successfully",
-                "performance_rating": overall_rating,
-            }
-        )
-
-
-class DashboardView(APIView):
-    """Dashboard statistics endpoint."""
-
-    def get(self, request):
-        """Get dashboard statistics."""
-        user = request.user
-
-        if user.role == "EMPLOYEE":
-            employee = getattr(user, "employee_profile", None)
-            if not employee:
-                return Response(
-                    {
-                        "active_tasks": 0,
-                        "unassigned_tasks": 0,
-                        "employee_capacity": 0,
-                        "skills_coverage": 0,
-                    }
-                )
-
-            active_tasks = TaskAssignment.objects.filter(
-                employee=employee, status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED"]
-            ).count()
-
-            capacity = employee.current_workload
-
-            data = {
-                "active_tasks": active_tasks,
-                "unassigned_tasks": 0,
-                "employee_capacity": round(capacity, 1),
-                "skills_coverage": 0,
-            }
-        else:
-            # Filter stats by PM's data
-            active_tasks = Task.objects.filter(
-                created_by=user, status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED"]
-            ).count()
-
-            unassigned_tasks = Task.objects.filter(
-                created_by=user, status__in=["UNASSIGNED", "DRAFT"]
-            ).count()
-
-            employees = Employee.objects.filter(manager=user)
-            if employees.exists():
-                total_capacity = sum(emp.current_workload for emp in employees)
-                avg_capacity = total_capacity / employees.count()
-            else:
-                avg_capacity = 0
-
-            # Skills coverage for PM's tasks
-            pm_tasks = Task.objects.filter(created_by=user)
-            tasks_with_skills = pm_tasks.exclude(task_skills__isnull=True).distinct()
-            total_tasks = pm_tasks.count()
-
-            if total_tasks > 0:
-                skills_coverage = (tasks_with_skills.count() / total_tasks) * 100
-            else:
-                skills_coverage = 0
-
-            data = {
-                "active_tasks": active_tasks,
-                "unassigned_tasks": unassigned_tasks,
-                "employee_capacity": round(avg_capacity, 1),
-                "skills_coverage": round(skills_coverage, 1),
-            }
-
-        serializer = DashboardStatsSerializer(data)
-        return Response(serializer.data)
-
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def debug_media(request):
-    """Debug view to check media file existence."""
-    import os
-
-    from django.conf import settings
-
-    media_root = settings.MEDIA_ROOT
-    media_url = settings.MEDIA_URL
-    path = request.GET.get("path", "")
-
-    exists = False
-    full_path = ""
-    folder_contents = []
-
-    if path:
-        full_path = os.path.join(media_root, path)
-        exists = os.path.exists(full_path)
-
-    # List media root contents
-    try:
-        if os.path.exists(media_root):
-            folder_contents = os.listdir(media_root)
-            # Check subfolders like 'cvs'
-            cvs_path = os.path.join(media_root, "cvs")
-            if os.path.exists(cvs_path):
-                folder_contents.extend([f"cvs/{f}" for f in os.listdir(cvs_path)])
-        else:
-            folder_contents = ["Media Root does not exist"]
-    except Exception as e:
-        folder_contents = [str(e)]
-
-    return Response(
-        {
-            "MEDIA_ROOT": media_root,
-            "MEDIA_URL": media_url,
-            "Requested Path": path,
-            "Full Path": full_path,
-            "Exists": exists,
-            "Folder Contents": folder_contents,
-            "DEBUG": settings.DEBUG,
-            "Service": "ITAS Backend API",
-        }
-    )
-
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def debug_email(request):
-    """Debug view to test email sending."""
-    from django.conf import settings
-    from django.core.mail import send_mail
-
-    recipient = request.GET.get("recipient")
-    if not recipient:
-        return Response(
-            {"message": "Please provide 'recipient' query parameter"},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
-
-    try:
-        send_mail(
-            "Debug Email Test",
-            f"This is a test email sent from {settings.EMAIL_HOST}",
-            settings.DEFAULT_FROM_EMAIL,
-            [recipient],
-            fail_silently=False,
-        )
-        return Response(
-            {
-                "status": "SUCCESS",
-                "message": f"Email sent to {recipient}",
-                "config": {
-                    "HOST": settings.EMAIL_HOST,
-                    "PORT": settings.EMAIL_PORT,
-                    "USER": (
-                        settings.EMAIL_HOST_USER[:3] + "***"
-                        if settings.EMAIL_HOST_USER
-                        else "NOT SET"
-                    ),
-                    "TLS": settings.EMAIL_USE_TLS,
-                },
-            }
-        )
-    except Exception as e:
-        return Response(
-            {
-                "status": "FAILED",
-                "error": str(e),
-                "config": {
-                    "HOST": settings.EMAIL_HOST,
-                    "PORT": settings.EMAIL_PORT,
-                    "USER": (
-                        settings.EMAIL_HOST_USER[:3] + "***"
-                        if settings.EMAIL_HOST_USER
-                        else "NOT SET"
-                    ),
-                    "TLS": settings.EMAIL_USE_TLS,
-                },
-            },
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
@@ -3,4 +3,4 @@ from .employee_views import EmployeeViewSet
 from .task_views import TaskViewSet
 from .project_views import ProjectViewSet
 from .dashboard_views import DashboardView, ReportsView
-from .debug_views import debug_email, debug_media
+from .debug_views import debug_email
@@ -4,8 +4,7 @@ from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.contrib.auth import authenticate, get_user_model
-from django.db import transaction
-from django.db.models import Q
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from core.models import User, Employee, Project, Task, TaskAssignment, Skill, AuditLog, CV
 from core.serializers import UserSerializer, EmployeeSerializer, ProjectSerializer, TaskSerializer, TaskAssignmentSerializer, TaskMatchSerializer
@@ -47,21 +46,10 @@ class AuthView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # 1. Try to find user by email or username
-        user = User.objects.filter(
-            Q(email__iexact=email_or_username) | Q(username__iexact=email_or_username)
-        ).first()
+        # EmailOrUsernameBackend resolves either identifier in a single query
+        authed = authenticate(request, username=email_or_username, password=password)
 
-        if not user:
-            return Response(
-                {"message": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED
-            )
-
-        # Use Django's authenticate to respect auth backends properly
-        # Some projects authenticate with username, not email.
-        authed = authenticate(request, username=user.username, password=password)
-
-        if not authed:
+        if authed is None:
             return Response(
                 {"message": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED
             )
@@ -97,11 +85,6 @@ class AuthView(APIView):
         if "email" in data:
             new_email = data["email"].strip().lower()
             if new_email and new_email != user.email:
-                if User.objects.filter(email=new_email).exclude(id=user.id).exists():
-                    return Response(
-                        {"message": "Email already in use"},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
                 user.email = new_email
 
         # Update Password
@@ -114,7 +97,15 @@ class AuthView(APIView):
                 )
             user.set_password(new_password)
 
-        user.save()
+        # The unique email constraint rejects addresses already in use
+        try:
+            with transaction.atomic():
+                user.save()
+        except IntegrityError:
+            return Response(
+                {"message": "Email already in use"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         # Serialize updated user
         user_serializer = UserSerializer(user)
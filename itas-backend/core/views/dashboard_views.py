@@ -4,12 +4,14 @@ from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.contrib.auth import authenticate, get_user_model
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Avg, Count, Q
 from django.utils import timezone
 from core.models import User, Employee, Project, Task, TaskAssignment, Skill, AuditLog, CV
 from core.serializers import UserSerializer, EmployeeSerializer, ProjectSerializer, TaskSerializer, TaskAssignmentSerializer, TaskMatchSerializer, DashboardStatsSerializer
 from core.services.audit_service import AuditService
+from core.services.cache_service import CacheService
 from core.services.matching_engine import MatchingEngine
 from core.services.cv_parser import CVParser
 from core.services.skill_extractor import SkillExtractor
@@ -18,6 +20,9 @@ from core.services.skill_extractor import SkillExtractor
 class ReportsView(APIView):
     """View for generating system reports."""
 
+    # Shares the dashboard namespace, so the same signals invalidate it
+    CACHE_TIMEOUT = 60
+
     def get(self, request):
         if request.user.role != "PM":
             return Response(
@@ -27,16 +32,34 @@ class ReportsView(APIView):
 
         user = request.user
 
-        # 1. Task Allocation Stats — scoped to this PM's tasks
-        pm_tasks = Task.objects.filter(created_by=user)
-        total_tasks = pm_tasks.count()
-        completed = pm_tasks.filter(status="COMPLETED").count()
-        assigned = pm_tasks.filter(status="ASSIGNED").count()
+        cache_key = CacheService.key("dashboard", "reports", user.id)
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._compute_report(user)
+            cache.set(cache_key, data, self.CACHE_TIMEOUT)
+
+        return Response(data)
 
-        # 2. Workload Distribution — scoped to this PM's employees
-        employees = Employee.objects.filter(manager=user)
+    def _compute_report(self, user):
+        # 1. Task Allocation Stats — scoped to this PM's tasks (one query)
+        task_stats = Task.objects.filter(created_by=user).aggregate(
+            total=Count("id"),
+            completed=Count("id", filter=Q(status="COMPLETED")),
+            assigned=Count("id", filter=Q(status="ASSIGNED")),
+        )
+        total_tasks = task_stats["total"]
+        completed = task_stats["completed"]
+        assigned = task_stats["assigned"]
+
+        # 2. Workload Distribution — scoped to this PM's employees; workload is
+        # annotated in SQL instead of a COUNT (plus a user fetch) per employee
+        employees = (
+            Employee.objects.filter(manager=user)
+            .select_related("user")
+            .annotate(workload=Employee.workload_expression())
+        )
         workload_data = [
-            {"name": e.name, "workload": e.current_workload, "title": e.title}
+            {"name": e.name, "workload": e.workload, "title": e.title}
             for e in employees
         ]
 
@@ -46,190 +69,99 @@ class ReportsView(APIView):
             assigned_at__gte=last_30_days, task__created_by=user
         ).count()
 
-        return Response(
-            {
-                "task_stats": {
-                    "total": total_tasks,
-                    "completed": completed,
-                    "assigned": assigned,
-                    "completion_rate": round(
-                        (completed / total_tasks * 100) if total_tasks else 0, 1
-                    ),
-                },
-                "workload_distribution": workload_data,
-                "recent_assignments": assignments,
-            }
-        )
+        return {
+            "task_stats": {
+                "total": total_tasks,
+                "completed": completed,
+                "assigned": assigned,
+                "completion_rate": round(
+                    (completed / total_tasks * 100) if total_tasks else 0, 1
+                ),
+            },
+            "workload_distribution": workload_data,
+            "recent_assignments": assignments,
+        }
 
 class DashboardView(APIView):
     """Dashboard statistics endpoint."""
 
+    # Stats are polled by the frontend; a short TTL bounds staleness for changes
+    # that bypass model signals (e.g. queryset.update()).
+    CACHE_TIMEOUT = 60
+
     def get(self, request):
         """Get dashboard statistics."""
         user = request.user
 
+        cache_key = CacheService.key("dashboard", user.id, user.role)
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._compute_stats(user)
+            cache.set(cache_key, data, self.CACHE_TIMEOUT)
+
+        serializer = DashboardStatsSerializer(data)
+        return Response(serializer.data)
+
+    def _compute_stats(self, user):
         if user.role == "EMPLOYEE":
             employee = getattr(user, "employee_profile", None)
             if not employee:
-                return Response(
-                    {
-                        "active_tasks": 0,
-                        "unassigned_tasks": 0,
-                        "employee_capacity": 0,
-                        "skills_coverage": 0,
-                    }
-                )
+                return {
+                    "active_tasks": 0,
+                    "unassigned_tasks": 0,
+                    "employee_capacity": 0,
+                    "skills_coverage": 0,
+                }
 
             active_tasks = TaskAssignment.objects.filter(
-                employee=employee, status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED"]
+                employee=employee, status__in=Employee.ACTIVE_STATUSES
             ).count()
 
-            capacity = employee.current_workload
+            # Same count drives the workload; no second COUNT via current_workload
+            capacity = Employee.workload_from_count(active_tasks)
 
-            data = {
+            return {
                 "active_tasks": active_tasks,
                 "unassigned_tasks": 0,
                 "employee_capacity": round(capacity, 1),
                 "skills_coverage": 0,
             }
-        else:
-            # Filter stats by PM's data
-            active_tasks = Task.objects.filter(
-                created_by=user, status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED"]
-            ).count()
-
-            unassigned_tasks = Task.objects.filter(
-                created_by=user, status__in=["UNASSIGNED", "DRAFT"]
-            ).count()
 
-            employees = Employee.objects.filter(manager=user)
-            if employees.exists():
-                total_capacity = sum(emp.current_workload for emp in employees)
-                avg_capacity = total_capacity / employees.count()
-            else:
-                avg_capacity = 0
-
-            # Skills coverage for PM's tasks
-            pm_tasks = Task.objects.filter(created_by=user)
-            tasks_with_skills = pm_tasks.exclude(task_skills__isnull=True).distinct()
-            total_tasks = pm_tasks.count()
-
-            if total_tasks > 0:
-                skills_coverage = (tasks_with_skills.count() / total_tasks) * 100
-            else:
-                skills_coverage = 0
-
-            data = {
-                "active_tasks": active_tasks,
-                "unassigned_tasks": unassigned_tasks,
-                "employee_capacity": round(avg_capacity, 1),
-                "skills_coverage": round(skills_coverage, 1),
-            }
-
-        serializer = DashboardStatsSerializer(data)
-        return Response(serializer.data)
-
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def debug_media(request):
-    """Debug view to check media file existence."""
-    import os
-
-    from django.conf import settings
-
-    media_root = settings.MEDIA_ROOT
-    media_url = settings.MEDIA_URL
-    path = request.GET.get("path", "")
-
-    exists = False
-    full_path = ""
-    folder_contents = []
+        # Average workload computed in SQL (one query, no per-employee COUNTs)
+        avg_capacity = (
+            Employee.objects.filter(manager=user)
+            .annotate(workload=Employee.workload_expression())
+            .aggregate(avg=Avg("workload"))["avg"]
+            or 0
+        )
 
-    if path:
-        full_path = os.path.join(media_root, path)
-        exists = os.path.exists(full_path)
+        # All task counts for the PM in one query. The task_skills join repeats
+        # rows per skill, hence distinct on every count.
+        task_counts = Task.objects.filter(created_by=user).aggregate(
+            active=Count(
+                "id",
+                filter=Q(status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED"]),
+                distinct=True,
+            ),
+            unassigned=Count(
+                "id", filter=Q(status__in=["UNASSIGNED", "DRAFT"]), distinct=True
+            ),
+            total=Count("id", distinct=True),
+            with_skills=Count("id", filter=Q(task_skills__isnull=False), distinct=True),
+        )
+        active_tasks = task_counts["active"]
+        unassigned_tasks = task_counts["unassigned"]
+        total_tasks = task_counts["total"]
 
-    # List media root contents
-    try:
-        if os.path.exists(media_root):
-            folder_contents = os.listdir(media_root)
-            # Check subfolders like 'cvs'
-            cvs_path = os.path.join(media_root, "cvs")
-            if os.path.exists(cvs_path):
-                folder_contents.extend([f"cvs/{f}" for f in os.listdir(cvs_path)])
+        # Skills coverage for PM's tasks
+        if total_tasks > 0:
+            skills_coverage = (task_counts["with_skills"] / total_tasks) * 100
         else:
-            folder_contents = ["Media Root does not exist"]
-    except Exception as e:
-        folder_contents = [str(e)]
-
-    return Response(
-        {
-            "MEDIA_ROOT": media_root,
-            "MEDIA_URL": media_url,
-            "Requested Path": path,
-            "Full Path": full_path,
-            "Exists": exists,
-            "Folder Contents": folder_contents,
-            "DEBUG": settings.DEBUG,
-            "Service": "ITAS Backend API",
-        }
-    )
+            skills_coverage = 0
 
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def debug_email(request):
-    """Debug view to test email sending."""
-    from django.conf import settings
-    from django.core.mail import send_mail
-
-    recipient = request.GET.get("recipient")
-    if not recipient:
-        return Response(
-            {"message": "Please provide 'recipient' query parameter"},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
-
-    try:
-        send_mail(
-            "Debug Email Test",
-            f"This is a test email sent from {settings.EMAIL_HOST}",
-            settings.DEFAULT_FROM_EMAIL,
-            [recipient],
-            fail_silently=False,
-        )
-        return Response(
-            {
-                "status": "SUCCESS",
-                "message": f"Email sent to {recipient}",
-                "config": {
-                    "HOST": settings.EMAIL_HOST,
-                    "PORT": settings.EMAIL_PORT,
-                    "USER": (
-                        settings.EMAIL_HOST_USER[:3] + "***"
-                        if settings.EMAIL_HOST_USER
-                        else "NOT SET"
-                    ),
-                    "TLS": settings.EMAIL_USE_TLS,
-                },
-            }
-        )
-    except Exception as e:
-        return Response(
-            {
-                "status": "FAILED",
-                "error": str(e),
-                "config": {
-                    "HOST": settings.EMAIL_HOST,
-                    "PORT": settings.EMAIL_PORT,
-                    "USER": (
-                        settings.EMAIL_HOST_USER[:3] + "***"
-                        if settings.EMAIL_HOST_USER
-                        else "NOT SET"
-                    ),
-                    "TLS": settings.EMAIL_USE_TLS,
-                },
-            },
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+        return {
+            "active_tasks": active_tasks,
+            "unassigned_tasks": unassigned_tasks,
+            "employee_capacity": round(avg_capacity, 1),
+            "skills_coverage": round(skills_coverage, 1),
+        }
@@ -3,12 +3,6 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from core.services.email_service import EmailService
 
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def debug_media(request):
-    """Debug endpoint for checking media setups."""
-    return JsonResponse({"status": "ok", "message": "Media debug endpoint works."})
-
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def debug_email(request):
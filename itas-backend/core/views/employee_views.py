@@ -1,32 +1,78 @@
+import re
+
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework import viewsets, status, exceptions
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
-from django.db import transaction
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch, Q
+from django.template.defaultfilters import filesizeformat
 from django.utils import timezone
 from core.models import User, Employee, Project, Task, TaskAssignment, Skill, AuditLog, CV
 from core.serializers import UserSerializer, EmployeeSerializer, ProjectSerializer, TaskSerializer, TaskAssignmentSerializer, TaskMatchSerializer
 from core.services.audit_service import AuditService
-from core.services.matching_engine import MatchingEngine
-from core.services.cv_parser import CVParser
-from core.services.skill_extractor import SkillExtractor
+from core.services.matching_engine import get_matching_engine
+from core.services.cv_parser import get_cv_parser
+from core.services.skill_extractor import get_skill_extractor
+from core.services.text_preprocessor import clean_extracted_text
+from core.views.mixins import FieldSelectionMixin
+
+_EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
 
 
-class EmployeeViewSet(viewsets.ModelViewSet):
+class EmployeeViewSet(FieldSelectionMixin, viewsets.ModelViewSet):
     """Employee endpoints."""
 
     queryset = Employee.objects.all()
     serializer_class = EmployeeSerializer
 
+    # Columns read by EmployeeSerializer on list/retrieve
+    READ_FIELDS = (
+        "title",
+        "email",
+        "team",
+        "role",
+        "user__username",
+        "user__first_name",
+        "user__last_name",
+        "cv__file",
+        "cv__status",
+        "cv__uploaded_at",
+        "cv__error_message",
+    )
+
     def get_queryset(self):
         """Filter employees based on user role."""
         user = self.request.user
-        queryset = Employee.objects.select_related("user", "manager").prefetch_related(
-            "skill_set"
-        )
+        if self.action in ("list", "retrieve"):
+            # Load only the columns EmployeeSerializer renders: no manager row,
+            # no user credentials and no CV text.
+            queryset = Employee.objects.select_related("user", "cv").only(
+                *self.READ_FIELDS
+            )
+            if self.wants_field("average_performance"):
+                queryset = queryset.annotate(
+                    performance_avg=Employee.performance_expression()
+                )
+        else:
+            queryset = Employee.objects.select_related("user", "manager", "cv")
+        if self.wants_field("skills"):
+            queryset = queryset.prefetch_related("skill_set")
+        if self.action in ("list", "retrieve") and (
+            self.wants_field("assigned_tasks") or self.wants_field("current_workload")
+        ):
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "taskassignment_set",
+                    queryset=TaskAssignment.objects.filter(
+                        status__in=Employee.ACTIVE_STATUSES
+                    ).select_related("task"),
+                    to_attr="active_assignments",
+                )
+            )
 
         if user.role == "EMPLOYEE":
             # Employees can only see their own profile
@@ -51,7 +97,8 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         if title:
             queryset = queryset.filter(title__icontains=title)
 
-        return queryset
+        # The performance annotation groups rows, which drops Meta.ordering
+        return queryset.order_by("-created_at")
 
     def create(self, request, *args, **kwargs):
         """Create new employee and associated user."""
@@ -73,38 +120,15 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Check if user exists
-        if User.objects.filter(email=email).exists():
-            return Response(
-                {"message": "User with this email already exists"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
         try:
             with transaction.atomic():
-                # Create User
-                username = email.split("@")[0]
-                # Ensure unique username
-                if User.objects.filter(username=username).exists():
-                    import uuid
-
-                    username = f"{username}_{uuid.uuid4().hex[:4]}"
-
-                import secrets
-                import string
-
-                random_password = "".join(
-                    secrets.choice(string.ascii_letters + string.digits)
-                    for _ in range(12)
-                )
-                user = User.objects.create_user(
-                    username=username,
-                    email=email,
-                    password=random_password,
-                    first_name=name.split(" ")[0],
-                    last_name=" ".join(name.split(" ")[1:]) if " " in name else "",
-                    role="EMPLOYEE",
-                )
+                # Create User; uniqueness is enforced by the database
+                user = self._create_employee_user(email, name)
+                if user is None:
+                    return Response(
+                        {"message": "User with this email already exists"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
 
                 # Create Employee
                 employee = Employee.objects.create(
@@ -117,23 +141,72 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                 # Add initial skills if provided
                 skills = data.get("skills", [])
                 if skills and isinstance(skills, list):
-                    for skill_name in skills:
-                        Skill.objects.create(
-                            employee=employee,
-                            name=skill_name,
-                            source="MANUAL",  # Created via form (even if auto-filled)
-                            confidence_score=1.0,
-                        )
-
-                serializer = self.get_serializer(employee)
-                AuditService.log(
-                    request.user, "CREATE", employee, f"Created employee {email}"
-                )
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
+                    Skill.objects.bulk_create(
+                        [
+                            Skill(
+                                employee=employee,
+                                name=skill_name,
+                                source="MANUAL",  # Created via form (even if auto-filled)
+                                confidence_score=1.0,
+                            )
+                            for skill_name in skills
+                        ],
+                        batch_size=Skill.BULK_BATCH_SIZE,
+                    )
 
         except Exception as e:
             return Response({"message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+        # Audit + serialization run after commit so the transaction only spans the writes
+        AuditService.log(request.user, "CREATE", employee, f"Created employee {email}")
+        # A new employee has no assignments yet; spare the serializer the lookups
+        employee.active_assignments = []
+        employee.performance_avg = None
+        serializer = self.get_serializer(employee)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    # Username suffixes tried before giving up on a colliding email prefix
+    USERNAME_ATTEMPTS = 5
+
+    def _create_employee_user(self, email, name):
+        """
+        Insert the User for a new employee, or return None if the email is taken.
+
+        The username is the email's local part; if that collides, a random
+        suffix is appended and the insert retried. Each attempt runs in its
+        own savepoint so a failed INSERT does not poison the outer transaction.
+        """
+        import secrets
+        import string
+        import uuid
+
+        random_password = "".join(
+            secrets.choice(string.ascii_letters + string.digits) for _ in range(12)
+        )
+        base_username = User.normalize_username(email.split("@")[0])
+        user = User(
+            username=base_username,
+            email=User.objects.normalize_email(email),
+            first_name=name.split(" ")[0],
+            last_name=" ".join(name.split(" ")[1:]) if " " in name else "",
+            role="EMPLOYEE",
+        )
+        # Hash once, not per retry
+        user.set_password(random_password)
+
+        for _ in range(self.USERNAME_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    user.save()
+                return user
+            except IntegrityError as e:
+                # The error names the violated constraint, so no follow-up query
+                if User.is_duplicate_email_error(e):
+                    return None
+                user.username = f"{base_username}_{uuid.uuid4().hex[:4]}"
+
+        raise IntegrityError(f"Could not find a free username for {email}")
+
     def perform_destroy(self, instance):
         """Delete employee and associated user."""
         if self.request.user.role != "PM":
@@ -148,6 +221,16 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         )
         user.delete()
 
+    def _oversized_upload_response(self, file):
+        """400 response for CVs over CV_MAX_UPLOAD_SIZE, checked before reading them."""
+        if file.size > settings.CV_MAX_UPLOAD_SIZE:
+            max_size = filesizeformat(settings.CV_MAX_UPLOAD_SIZE)
+            return Response(
+                {"message": f"File is too large (max {max_size})"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return None
+
     @action(detail=False, methods=["post"], url_path="analyze")
     def analyze_cv(self, request):
         """
@@ -160,11 +243,17 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             )
 
         file = request.FILES["file"]
+        oversized = self._oversized_upload_response(file)
+        if oversized is not None:
+            return oversized
+
+        # Read the upload once; validation and extraction share the bytes
+        raw = file.read()
 
         # Parse PDF
-        parser = CVParser()
-        is_pdf = parser.is_valid_pdf(file)
-        is_docx = parser.is_valid_docx(file)
+        parser = get_cv_parser()
+        is_pdf = parser.is_valid_pdf(raw)
+        is_docx = not is_pdf and parser.is_valid_docx(raw)
 
         if not (is_pdf or is_docx):
             return Response(
@@ -172,19 +261,12 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Read file
-        if hasattr(file, "read"):
-            file_content = file.read()
-            file.seek(0)
-        else:
-            file_content = file
-
         try:
             extracted_text = ""
             if is_pdf:
-                extracted_text = parser.extract_text_from_pdf(file)
+                extracted_text = parser.extract_text_from_pdf(raw)
             elif is_docx:
-                extracted_text = parser.extract_text_from_docx(file)
+                extracted_text = parser.extract_text_from_docx(raw)
 
             if not extracted_text:
                 raise ValueError("Could not extract text")
@@ -205,9 +287,7 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                 details["title"] = predicted_title
 
         # Basic Email Extraction
-        import re
-
-        email_match = re.search(r"[\w\.-]+@[\w\.-]+\.\w+", extracted_text)
+        email_match = _EMAIL_RE.search(extracted_text)
         if email_match:
             details["email"] = email_match.group(0)
         else:
@@ -215,15 +295,8 @@ class EmployeeViewSet(viewsets.ModelViewSet):
 
         # Extract Skills
         try:
-            extractor = SkillExtractor()
-            
-            import re
-            cleaned_text = extracted_text
-            if re.search(r"\b([A-Za-z]\s){2,}[A-Za-z]\b", cleaned_text):
-                cleaned_text = re.sub(r"([A-Za-z])\s(?=[A-Za-z]\b)", r"\1", cleaned_text)
-            cleaned_text = re.sub(r"\b([A-Za-z])\s([A-Za-z]{3,})\b", r"\1\2", cleaned_text)
-
-            skills_data = extractor.extract_skills(cleaned_text)
+            extractor = get_skill_extractor()
+            skills_data = extractor.extract_skills(clean_extracted_text(extracted_text))
             details["skills"] = [s["name"] for s in skills_data]
             
         except Exception as e:
@@ -253,10 +326,15 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Validate File Content
-        parser = CVParser()
+        oversized = self._oversized_upload_response(file)
+        if oversized is not None:
+            return oversized
+
+        # Validate File Content. The parser reads the upload in place (large
+        # uploads are already a temp file on disk) instead of copying it.
+        parser = get_cv_parser()
         is_pdf = parser.is_valid_pdf(file)
-        is_docx = parser.is_valid_docx(file)
+        is_docx = not is_pdf and parser.is_valid_docx(file)
 
         if not (is_pdf or is_docx):
             return Response(
@@ -265,14 +343,17 @@ class EmployeeViewSet(viewsets.ModelViewSet):
 
         # Create or update CV record
         cv, created = CV.objects.get_or_create(employee=employee)
-        cv.file = file
+        # Storage copies the upload chunk by chunk; the worker fetches the file
+        # back from storage, not from this request
+        cv.file.save(file.name, file, save=False)
         cv.status = "PROCESSING"
         cv.error_message = None
+        cv.parse_attempts = 0
         cv.save()
 
-        # Process CV in background celery task
+        # Process CV in background celery task once the CV row is committed
         from core.tasks import parse_cv_async
-        parse_cv_async.delay(cv.id)
+        transaction.on_commit(lambda: parse_cv_async.delay(cv.id))
 
         return Response(
             {"message": "CV uploaded and processing started", "status": "PROCESSING"}
@@ -296,30 +377,57 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
+        # Load the active assignments once; the serializer's assigned_tasks, the
+        # workload figure and the task rows below all reuse this list.
+        employee.active_assignments = list(
+            employee.taskassignment_set.filter(
+                status__in=Employee.ACTIVE_STATUSES
+            ).select_related("task")
+        )
         employee_data = EmployeeSerializer(employee).data
 
-        active_assignments = TaskAssignment.objects.filter(
-            employee=employee, status__in=["ASSIGNED", "IN_PROGRESS", "BLOCKED"]
-        ).select_related("task")
+        # Plain rows are enough for completed history; skip model instantiation
+        task_fields = (
+            "task_id",
+            "task__title",
+            "task__description",
+            "status",
+            "task__priority",
+            "suitability_score",
+            "task__due_date",
+        )
+
+        active_assignments = [
+            {
+                "task_id": a.task_id,
+                "task__title": a.task.title,
+                "task__description": a.task.description,
+                "status": a.status,
+                "task__priority": a.task.priority,
+                "suitability_score": a.suitability_score,
+                "task__due_date": a.task.due_date,
+            }
+            for a in employee.active_assignments
+        ]
 
         completed_assignments = TaskAssignment.objects.filter(
             employee=employee, status="COMPLETED"
-        ).select_related("task").order_by("-completed_at")[:5]
-
-        tasks_data = []
-        for assignment in list(active_assignments) + list(completed_assignments):
-            task = assignment.task
-            tasks_data.append(
-                {
-                    "id": str(task.id),
-                    "title": task.title,
-                    "description": task.description,
-                    "status": assignment.status,
-                    "priority": task.priority,
-                    "suitability_score": assignment.suitability_score,
-                    "due_date": task.due_date.isoformat() if task.due_date else None,
-                }
-            )
+        ).order_by("-completed_at").values(*task_fields)[:5]
+
+        tasks_data = [
+            {
+                "id": str(row["task_id"]),
+                "title": row["task__title"],
+                "description": row["task__description"],
+                "status": row["status"],
+                "priority": row["task__priority"],
+                "suitability_score": row["suitability_score"],
+                "due_date": (
+                    row["task__due_date"].isoformat() if row["task__due_date"] else None
+                ),
+            }
+            for row in [*active_assignments, *completed_assignments]
+        ]
 
         return Response(
             {
@@ -0,0 +1,27 @@
+class FieldSelectionMixin:
+    """
+    Lets read requests trim the response with ``?fields=id,name``.
+
+    The requested names are forwarded to serializers that accept a ``fields``
+    kwarg, and ``requested_fields()`` lets ``get_queryset`` skip prefetches
+    for fields that will not be rendered.
+    """
+
+    def requested_fields(self):
+        """Set of requested field names, or None when all fields are wanted."""
+        if self.request.method != "GET":
+            return None
+        fields = self.request.query_params.get("fields")
+        if not fields:
+            return None
+        return {name.strip() for name in fields.split(",") if name.strip()}
+
+    def wants_field(self, name):
+        fields = self.requested_fields()
+        return fields is None or name in fields
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.requested_fields()
+        if fields is not None:
+            kwargs.setdefault("fields", fields)
+        return super().get_serializer(*args, **kwargs)
@@ -1,3 +1,5 @@
+import logging
+
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework import viewsets, status, exceptions
 from rest_framework.decorators import action, api_view, permission_classes
@@ -5,37 +7,71 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.contrib.auth import authenticate, get_user_model
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from django.utils import timezone
 from core.models import User, Employee, Project, Task, TaskAssignment, TaskSkillEvaluation, Skill, AuditLog, CV
 from core.serializers import UserSerializer, EmployeeSerializer, ProjectSerializer, TaskSerializer, TaskAssignmentSerializer, TaskMatchSerializer
 from core.services.audit_service import AuditService
-from core.services.matching_engine import MatchingEngine
-from core.services.cv_parser import CVParser
-from core.services.skill_extractor import SkillExtractor
+from core.services.match_service import MatchService
+from core.services.matching_engine import get_matching_engine
+from core.services.cv_parser import get_cv_parser
+from core.services.skill_extractor import get_skill_extractor
+from core.tasks import refresh_recommendations_async
+from core.views.mixins import FieldSelectionMixin
+
+logger = logging.getLogger(__name__)
 
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(FieldSelectionMixin, viewsets.ModelViewSet):
     """Task endpoints."""
 
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
     pagination_class = None  # Disable pagination for now, return all results
 
+    # Serializer fields backed by the task's assignment rows
+    ASSIGNMENT_FIELDS = (
+        "assigned_to",
+        "assigned_to_name",
+        "employee_notes",
+        "performance_rating",
+        "performance_comments",
+    )
+
     def get_queryset(self):
         """Filter tasks based on user role."""
         user = self.request.user
-        queryset = Task.objects.select_related(
-            "created_by", "project"
-        ).prefetch_related("task_skills")
+        queryset = Task.objects.select_related("created_by", "project")
+        if self.action in ("list", "retrieve"):
+            # Only project.title is rendered; skip the TEXT columns nobody reads
+            deferred = ["project__description"]
+            if not self.wants_field("description"):
+                deferred.append("description")
+            queryset = queryset.defer(*deferred)
+        if self.wants_field("requiredSkills"):
+            queryset = queryset.prefetch_related("task_skills")
+        if self.action in ("list", "retrieve") and any(
+            self.wants_field(name) for name in self.ASSIGNMENT_FIELDS
+        ):
+            # Newest first, so the serializer can take the head of the list
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "assignments",
+                    queryset=TaskAssignment.objects.filter(
+                        status__in=Employee.ACTIVE_STATUSES + ["COMPLETED"]
+                    )
+                    .select_related("employee__user")
+                    .order_by("-assigned_at"),
+                    to_attr="visible_assignments",
+                )
+            )
 
         if user.role == "EMPLOYEE":
             employee = getattr(user, "employee_profile", None)
             if employee:
-                assigned_task_ids = TaskAssignment.objects.filter(
-                    employee=employee
-                ).values_list("task_id", flat=True)
-                queryset = queryset.filter(id__in=assigned_task_ids)
+                # A join rather than an IN (...) list; unique_together on
+                # (task, employee) means it cannot duplicate tasks.
+                queryset = queryset.filter(assignments__employee=employee)
         else:
             # PMs see only tasks they created
             queryset = queryset.filter(created_by=user)
@@ -43,7 +79,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         return queryset.order_by("-created_at")
 
     def create(self, request, *args, **kwargs):
-        """Create task and return matches."""
+        """Create task and queue its match computation."""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
@@ -53,17 +89,31 @@ class TaskViewSet(viewsets.ModelViewSet):
         # Get the created task instance
         task = serializer.instance
 
-        # Calculate matches
-        engine = MatchingEngine()
-        matches = engine.find_best_matches(task, limit=5, min_score=40.0)
+        # Matches are scored by a worker once the task is committed; clients
+        # poll the matches endpoint, which reports "pending" until then. With a
+        # per-process cache the worker's result would never be seen here, so
+        # the endpoint computes them on first read instead.
+        if MatchService.worker_shares_cache():
+            MatchService.mark_pending(task)
+            transaction.on_commit(lambda: self._queue_match_refresh(task))
 
         # Serialize response
         response_data = serializer.data
-        response_data["matches"] = matches
+        response_data["matches"] = []
 
         headers = self.get_success_headers(serializer.data)
         return Response(response_data, status=status.HTTP_201_CREATED, headers=headers)
 
+    @staticmethod
+    def _queue_match_refresh(task):
+        try:
+            refresh_recommendations_async.delay(task.id)
+        except Exception:
+            # Broker unavailable: the task is already saved, so let the matches
+            # endpoint compute inline rather than wait out the pending marker.
+            logger.exception("Could not queue match refresh for task %s", task.id)
+            MatchService.clear_pending(task.id)
+
     def perform_create(self, serializer):
         """Create task with current user as creator."""
         serializer.save(created_by=self.request.user)
@@ -80,7 +130,7 @@ class TaskViewSet(viewsets.ModelViewSet):
 
         # Parse PDF
         # Parse Document
-        parser = CVParser()  # Valid for generic docs too
+        parser = get_cv_parser()  # Valid for generic docs too
 
         is_pdf = parser.is_valid_pdf(file)
         is_docx = parser.is_valid_docx(file)
@@ -107,7 +157,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         details = parser.extract_task_details(extracted_text)
 
         # Extract Skills using SkillExtractor
-        extractor = SkillExtractor()
+        extractor = get_skill_extractor()
         skills_data = extractor.extract_skills(extracted_text)
         details["requiredSkills"] = [
             extractor.normalize_skill_name(s["name"]) for s in skills_data
@@ -119,64 +169,11 @@ class TaskViewSet(viewsets.ModelViewSet):
     def get_matches(self, request, pk=None):
         """Get recommended employee matches for a task."""
         task = self.get_object()
-        
-        from django.core.cache import cache
-        from django.conf import settings
-        
-        cached_matches = cache.get(f"task_matches_{task.id}")
-        if cached_matches:
-            return Response(cached_matches)
-
-        engine = MatchingEngine()
-        rule_based_results = engine.find_best_matches(task, limit=10, min_score=50.0)
-        
-        try:
-            from apps.ai.services.recommendation_service import RecommendationService
-            ml_results = RecommendationService().get_recommendations(task, limit=10)
-        except Exception as e:
-            print(f"Error calling RecommendationService: {e}")
-            ml_results = []
-            
-        if settings.SHADOW_ML_DEPLOYMENT:
-            print(f"SHADOW_ML_DEPLOYMENT: ML Results would have been: {ml_results}")
-            serializer = TaskMatchSerializer(rule_based_results, many=True)
-            result_data = serializer.data
-        else:
-            if not ml_results:
-                serializer = TaskMatchSerializer(rule_based_results, many=True)
-                result_data = serializer.data
-            else:
-                # Merge results: if ml_results is non-empty, blend scores:
-                # For each candidate, final_score = (rule_score * 0.6) + (ml_score * 0.4)
-                rule_dict = {m['employee_id']: m['suitability_score'] for m in rule_based_results}
-                merged_results = []
-                for ml_match in ml_results:
-                    emp_id = ml_match['employee_id']
-                    rule_score = rule_dict.get(emp_id, 0.0)
-                    ml_score = ml_match['prediction_score']
-                    final_score = (rule_score * 0.6) + (ml_score * 0.4)
-                    ml_match['suitability_score'] = final_score
-                    merged_results.append(ml_match)
-                    
-                # Add employees that only appear in rule_based
-                ml_emp_ids = {m['employee_id'] for m in ml_results}
-                for r in rule_based_results:
-                    if r['employee_id'] not in ml_emp_ids:
-                        # ml_score is 0 for them
-                        final_score = r['suitability_score'] * 0.6
-                        r['suitability_score'] = final_score
-                        merged_results.append(r)
-                        
-                # Sort by final_score descending
-                merged_results.sort(key=lambda x: x['suitability_score'], reverse=True)
-                # Take top 10
-                merged_results = merged_results[:10]
-                result_data = merged_results
-                
-        # Cache for next time
-        cache.set(f"task_matches_{task.id}", result_data, timeout=3600)
-        
-        return Response(result_data)
+        matches = MatchService.get_matches(task)
+        if matches is None:
+            # Still being scored by the worker queued in create()
+            return Response({"pending": True}, status=status.HTTP_202_ACCEPTED)
+        return Response(matches)
 
     @action(detail=True, methods=["post"], url_path="assign")
     def assign_task(self, request, pk=None):
@@ -190,19 +187,24 @@ class TaskViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            employee = Employee.objects.get(id=employee_id)
-        except Employee.DoesNotExist:
+        employee = (
+            Employee.objects.select_related("user").filter(id=employee_id).first()
+        )
+        if employee is None:
             return Response(
                 {"message": "Employee not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        engine = MatchingEngine()
+        # Scored before taking the lock so the row is held only for the writes
+        engine = get_matching_engine()
         score = engine.calculate_suitability_score(employee, task, task.required_skills)
 
         active_statuses = ["ASSIGNED", "IN_PROGRESS", "BLOCKED"]
 
         with transaction.atomic():
+            # Concurrent assigns of the same task queue on the task row, so the
+            # cancel + get_or_create below cannot leave two active assignments.
+            task = Task.objects.select_for_update().get(pk=task.pk)
             TaskAssignment.objects.filter(
                 task=task, status__in=active_statuses
             ).exclude(employee=employee).update(status="CANCELLED")
@@ -222,7 +224,7 @@ class TaskViewSet(viewsets.ModelViewSet):
                 assignment.save()
 
             task.status = "ASSIGNED"
-            task.save()
+            task.save(update_fields=["status", "updated_at"])
 
         AuditService.log(
             request.user,
@@ -6,8 +6,13 @@ port = os.getenv("PORT", "10000")
 bind = f"0.0.0.0:{port}"
 
 # Worker configuration optimized for low-memory environments (Render Free Tier)
-workers = 1
-threads = 2
+# The API is synchronous Django/DRF and mostly waits on the database, storage
+# and the CV upload body, so extra threads add concurrency without another
+# copy of the app (and its NLP models) in memory. Each thread holds its own
+# DB connection: keep workers * threads under the database/pooler limit.
+worker_class = "gthread"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
 timeout = 120
 preload_app = True
 accesslog = "-"
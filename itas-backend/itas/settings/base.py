@@ -78,13 +78,54 @@ TEMPLATES = [
 WSGI_APPLICATION = "itas.wsgi.application"
 
 # Database
+# Set DB_TRANSACTION_POOLER=True when DATABASE_URL points at a transaction-mode
+# pooler (PgBouncer, Supabase pooler on :6543). The pooler owns connection reuse,
+# so Django must not keep connections open or rely on server-side cursors.
+DB_TRANSACTION_POOLER = os.getenv("DB_TRANSACTION_POOLER", "False") == "True"
+
 DATABASES = {
     "default": dj_database_url.config(
         default=os.getenv("DATABASE_URL", f"sqlite:///{BASE_DIR / 'db.sqlite3'}"),
-        conn_max_age=600,
+        conn_max_age=0 if DB_TRANSACTION_POOLER else 600,
         ssl_require=False,
     )
 }
+# Only explicit transaction.atomic() blocks around writes; reads stay outside
+# a transaction so pooled connections are released between statements.
+DATABASES["default"]["ATOMIC_REQUESTS"] = False
+if DB_TRANSACTION_POOLER:
+    DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True
+
+# Cap runaway queries (milliseconds, 0 disables). Sent as a startup option on
+# direct PostgreSQL connections; transaction-mode poolers reject startup
+# options, so behind one set it on the role instead
+# (ALTER ROLE ... SET statement_timeout = '5s').
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "5000"))
+if (
+    DB_STATEMENT_TIMEOUT_MS
+    and not DB_TRANSACTION_POOLER
+    and DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql"
+):
+    DATABASES["default"].setdefault("OPTIONS", {})["options"] = (
+        f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+    )
+
+# Password hashing: Argon2id first; existing PBKDF2 hashes are still verified
+# and upgraded to Argon2 on the user's next successful login. Django's Argon2
+# defaults (time_cost=2, memory_cost=100 MiB, parallelism=8) take ~200 ms per
+# hash, inside the interactive login budget, so they are not overridden.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+# Log in with either email or username (see core.authentication)
+AUTHENTICATION_BACKENDS = [
+    "core.authentication.EmailOrUsernameBackend",
+]
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -105,11 +146,44 @@ USE_TZ = True
 # Static & Media
 STATIC_URL = "/static/"
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# Media (CV uploads) go to S3-compatible object storage when a bucket is set.
+# File URLs are then short-lived presigned links served by the bucket, so no
+# gunicorn thread is spent streaming files. Credentials come from the standard
+# AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY environment variables.
+AWS_STORAGE_BUCKET_NAME = os.getenv("AWS_STORAGE_BUCKET_NAME", "")
+USE_S3_MEDIA = bool(AWS_STORAGE_BUCKET_NAME)
+AWS_S3_REGION_NAME = os.getenv("AWS_S3_REGION_NAME") or None
+# Non-AWS providers (R2, Spaces, MinIO) need their endpoint
+AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL") or None
+AWS_DEFAULT_ACL = None  # objects stay private; access is via presigned URLs
+AWS_QUERYSTRING_AUTH = True
+AWS_QUERYSTRING_EXPIRE = int(os.getenv("AWS_QUERYSTRING_EXPIRE", "600"))
+AWS_S3_FILE_OVERWRITE = False
+
+STORAGES = {
+    "default": {
+        "BACKEND": (
+            "storages.backends.s3.S3Storage"
+            if USE_S3_MEDIA
+            else "django.core.files.storage.FileSystemStorage"
+        ),
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+
+# Uploads larger than this are spooled to a temp file instead of held in memory
+FILE_UPLOAD_MAX_MEMORY_SIZE = int(
+    os.getenv("FILE_UPLOAD_MAX_MEMORY_SIZE", str(2 * 1024 * 1024))
+)
+# Largest CV accepted by the upload/analyze endpoints (bytes)
+CV_MAX_UPLOAD_SIZE = int(os.getenv("CV_MAX_UPLOAD_SIZE", str(10 * 1024 * 1024)))
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "core.User"
 
@@ -181,6 +255,13 @@ CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
+# CPU-heavy CV parsing gets its own queue so it cannot starve short tasks
+CELERY_TASK_ROUTES = {
+    "core.tasks.parse_cv_async": {"queue": "cv_parsing"},
+}
+# Reserve one task at a time so long parses are not stuck behind each other.
+# Late acks are enabled per task (see core.tasks.parse_cv_async).
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 
 # Sentry Monitoring Setup
 import sentry_sdk
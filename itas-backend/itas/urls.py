@@ -3,11 +3,12 @@ URL configuration for itas project.
 """
 
 import os
+from itertools import islice
 
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse
 from django.urls import include, path, re_path
 from django.views.static import serve
 
@@ -16,8 +17,22 @@ def home(request):
     return JsonResponse({"message": "ITAS Backend API is running", "status": "ok"})
 
 
+# Cap on entries listed by debug_media; keeps the response small on big media dirs
+DEBUG_MEDIA_MAX_ENTRIES = 500
+
+
+def _scan_names(path, prefix, limit):
+    """Up to ``limit`` entry names under ``path``, via a single scandir pass."""
+    with os.scandir(path) as entries:
+        return [f"{prefix}{entry.name}" for entry in islice(entries, limit)]
+
+
 def debug_media(request):
     """Debug view to check media file existence."""
+    # Exposes filesystem layout, so it only exists in DEBUG deployments
+    if not settings.DEBUG:
+        raise Http404()
+
     media_root = settings.MEDIA_ROOT
     media_url = settings.MEDIA_URL
     path = request.GET.get("path", "")
@@ -25,6 +40,7 @@ def debug_media(request):
     exists = False
     full_path = ""
     folder_contents = []
+    limit = DEBUG_MEDIA_MAX_ENTRIES
 
     if path:
         full_path = os.path.join(media_root, path)
@@ -33,16 +49,20 @@ def debug_media(request):
     # List media root contents
     try:
         if os.path.exists(media_root):
-            folder_contents = os.listdir(media_root)
+            folder_contents = _scan_names(media_root, "", limit + 1)
             # Check subfolders like 'cvs'
             cvs_path = os.path.join(media_root, "cvs")
-            if os.path.exists(cvs_path):
-                folder_contents.extend([f"cvs/{f}" for f in os.listdir(cvs_path)])
+            if len(folder_contents) <= limit and os.path.isdir(cvs_path):
+                folder_contents += _scan_names(
+                    cvs_path, "cvs/", limit + 1 - len(folder_contents)
+                )
         else:
             folder_contents = ["Media Root does not exist"]
     except Exception as e:
         folder_contents = [str(e)]
 
+    truncated = len(folder_contents) > limit
+
     return JsonResponse(
         {
             "MEDIA_ROOT": media_root,
@@ -50,7 +70,8 @@ def debug_media(request):
             "Requested Path": path,
             "Full Path": full_path,
             "Exists": exists,
-            "Folder Contents": folder_contents,
+            "Folder Contents": folder_contents[:limit],
+            "Truncated": truncated,
             "DEBUG": settings.DEBUG,
             "Service": "ITAS Backend",
         }
@@ -66,9 +87,9 @@ urlpatterns = [
 
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-else:
-    # Serve media in production for demo purposes (usually handled by Nginx/S3)
-    # This captures everything under /media/
+elif not settings.USE_S3_MEDIA:
+    # Without object storage, serve media from disk for demo purposes.
+    # With USE_S3_MEDIA, CV links point straight at the bucket instead.
     urlpatterns += [
         re_path(r"^media/(?P<path>.*)$", serve, {"document_root": settings.MEDIA_ROOT}),
     ]
@@ -162,6 +162,23 @@ export async function getTaskMatches(taskId: string): Promise<TaskMatch[]> {
     return normalizeList<TaskMatch>(res.data);
 }
 
+/**
+ * Matches for a newly created task. The backend scores it in a worker and
+ * answers 202 {pending: true} until then, so poll with a short backoff.
+ */
+export async function waitForTaskMatches(taskId: string, attempts = 6): Promise<TaskMatch[]> {
+    let delay = 300;
+    for (let i = 0; i < attempts; i++) {
+        const res = await api.get(withSlash(`/tasks/${taskId}/matches`));
+        if (!(res.data && typeof res.data === "object" && "pending" in res.data)) {
+            return normalizeList<TaskMatch>(res.data);
+        }
+        await new Promise(r => setTimeout(r, delay));
+        delay = Math.min(delay * 2, 3000);
+    }
+    return [];
+}
+
 export async function uploadTaskDocument(file: File) {
     const form = new FormData();
     form.append("file", file);
@@ -1,7 +1,7 @@
 import { useState, type FormEvent } from "react";
 import TagInput from "../../components/common/TagInput";
 import { api } from "../../api/client";
-import { uploadTaskDocument, assignTask } from "../../api/tasks";
+import { uploadTaskDocument, assignTask, waitForTaskMatches } from "../../api/tasks";
 import { fetchProjects, type Project } from "../../api/projects";
 import { useQuery, useQueryClient } from "@tanstack/react-query";
 import { useLocation } from "react-router-dom";
@@ -112,9 +112,12 @@ export default function TaskCreate() {
         project_id: projectId || undefined,
       });
 
-      // Capture matches if returned
-      const newMatches = res.data.matches || [];
+      // Matches are scored in the background; wait for them if not returned inline
       const newTaskId = res.data.id;
+      let newMatches: Match[] = res.data.matches || [];
+      if (newMatches.length === 0 && newTaskId) {
+        newMatches = (await waitForTaskMatches(newTaskId).catch(() => [])) as Match[];
+      }
 
       // Invalidate queries to refresh dashboard
       queryClient.invalidateQueries({ queryKey: ["tasks"] });